@@ -226,6 +226,30 @@ class TaskStarLineSchema(BaseModel):
         return data
 
 
+def _index_by_id(items: list, id_field: str, generate_id) -> dict:
+    """
+    Key a list of task or dependency entries by their ID field in one pass.
+
+    Dict entries missing the ID get one from ``generate_id``; schema objects
+    are keyed by their attribute. Anything else is dropped.
+
+    :param items: List of dicts or schema objects
+    :param id_field: Name of the ID field ("task_id" or "line_id")
+    :param generate_id: Callable returning a fresh ID
+    :return: Dict mapping ID to entry
+    """
+    indexed = {}
+    for item in items:
+        if isinstance(item, dict):
+            item_id = item.get(id_field)
+            if not item_id:
+                item_id = item[id_field] = generate_id()
+            indexed[item_id] = item
+        elif hasattr(item, id_field):
+            indexed[getattr(item, id_field)] = item
+    return indexed
+
+
 class TaskOrionSchema(BaseModel):
     """
     Pydantic BaseModel for TaskOrion serialization/deserialization.
@@ -273,41 +297,21 @@ class TaskOrionSchema(BaseModel):
     def convert_lists_to_dicts(cls, data):
         """Convert tasks and dependencies from List to Dict format if needed."""
         if isinstance(data, dict):
-            # Convert tasks from List to Dict
-            if "tasks" in data and isinstance(data["tasks"], list):
-                tasks_dict = {}
-                for task_data in data["tasks"]:
-                    if isinstance(task_data, dict):
-                        # Ensure task has a task_id for use as key
-                        task_id = task_data.get("task_id")
-                        if not task_id:
-                            # Generate task_id if not present
-                            id_manager = IDManager()
-                            task_id = id_manager.generate_task_id()
-                            task_data["task_id"] = task_id
-                        tasks_dict[task_id] = task_data
-                    elif hasattr(task_data, "task_id"):
-                        # Handle TaskStarSchema objects
-                        tasks_dict[task_data.task_id] = task_data
-                data["tasks"] = tasks_dict
-
-            # Convert dependencies from List to Dict
-            if "dependencies" in data and isinstance(data["dependencies"], list):
-                deps_dict = {}
-                for dep_data in data["dependencies"]:
-                    if isinstance(dep_data, dict):
-                        # Ensure dependency has a line_id for use as key
-                        line_id = dep_data.get("line_id")
-                        if not line_id:
-                            # Generate line_id if not present
-                            id_manager = IDManager()
-                            line_id = id_manager.generate_line_id()
-                            dep_data["line_id"] = line_id
-                        deps_dict[line_id] = dep_data
-                    elif hasattr(dep_data, "line_id"):
-                        # Handle TaskStarLineSchema objects
-                        deps_dict[dep_data.line_id] = dep_data
-                data["dependencies"] = deps_dict
+            id_manager = IDManager()
+
+            # Convert tasks from List to Dict, keyed by task_id
+            tasks = data.get("tasks")
+            if isinstance(tasks, list):
+                data["tasks"] = _index_by_id(
+                    tasks, "task_id", id_manager.generate_task_id
+                )
+
+            # Convert dependencies from List to Dict, keyed by line_id
+            dependencies = data.get("dependencies")
+            if isinstance(dependencies, list):
+                data["dependencies"] = _index_by_id(
+                    dependencies, "line_id", id_manager.generate_line_id
+                )
 
         return data
 
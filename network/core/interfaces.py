@@ -28,6 +28,9 @@ from .types import (
 class ITask(ABC):
     """Interface for task objects."""
 
+    # Empty slots so slotted implementations don't regain a __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def task_id(self) -> TaskId:
@@ -105,6 +108,8 @@ class ITaskFactory(ABC):
 class IDependency(ABC):
     """Interface for task dependencies."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def source_task_id(self) -> TaskId:
@@ -172,6 +177,8 @@ class IDependencyResolver(ABC):
 class IOrion(ABC):
     """Interface for orion objects."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def orion_id(self) -> OrionId:
@@ -7,10 +7,13 @@ dynamic modification, and advanced dependency handling capabilities.
 """
 
 
+import json
+import math
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from network.orion.enums import OrionState
 from network.visualization.dag_visualizer import DAGVisualizer
@@ -22,10 +25,100 @@ from .enums import OrionState, TaskStatus
 from .task_star import TaskStar
 from .task_star_line import TaskStarLine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# orjson options for to_json, combined once instead of on every call
+if orjson is not None:
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 if TYPE_CHECKING:
     from network.agents.schema import TaskOrionSchema
 
 
+def _has_non_finite(data: Any) -> bool:
+    """
+    Check whether data holds a NaN or infinite float at any depth.
+
+    :param data: JSON serializable data
+    :return: True if a non-finite float is present
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(item) for item in data)
+    return False
+
+
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string, using orjson when available.
+
+    Falls back to the standard library for values orjson rejects, such as
+    integers wider than 64 bits, and for non-finite floats, which orjson
+    writes as null where json.dumps writes NaN and Infinity.
+
+    :param data: JSON serializable data
+    :return: JSON string with two-space indentation
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=_ORJSON_DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            encoded = None
+        # Non-finite floats only ever surface as null, so skip the walk otherwise
+        if encoded is not None and not (
+            b"null" in encoded and _has_non_finite(data)
+        ):
+            return encoded.decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _loads_json(json_data: Any) -> Any:
+    """
+    Parse a JSON string or bytes, using orjson when available.
+
+    Falls back to the standard library when orjson rejects the document,
+    so the NaN and Infinity tokens written by json.dumps still load.
+
+    :param json_data: JSON document
+    :return: Parsed data
+    :raises json.JSONDecodeError: If JSON parsing fails
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_data)
+
+
+# Orion state lookup tables built once, so to_dict/from_dict skip rebuilding them
+_ORION_STATE_VALUES = {state: state.value for state in OrionState}
+_ORION_STATE_BY_NAME = {
+    "CREATED": OrionState.CREATED,
+    "READY": OrionState.READY,
+    "EXECUTING": OrionState.EXECUTING,
+    "COMPLETED": OrionState.COMPLETED,
+    "FAILED": OrionState.FAILED,
+    "PARTIALLY_FAILED": OrionState.PARTIALLY_FAILED,
+}
+
+# MessagePack encoder and decoder, built once and reused across calls
+if msgspec is not None:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder(dict)
+
+
 class TaskOrion(IOrion):
     """
     Manages a DAG of tasks (TaskOrion) with comprehensive orchestration capabilities.
@@ -40,6 +133,19 @@ class TaskOrion(IOrion):
     Implements IDAGManager interface for consistent DAG operations.
     """
 
+    __slots__ = (
+        "_orion_id",
+        "_name",
+        "_state",
+        "_tasks",
+        "_dependencies",
+        "_metadata",
+        "_created_at",
+        "_updated_at",
+        "_execution_start_time",
+        "_execution_end_time",
+    )
+
     def __init__(
         self,
         orion_id: Optional[str] = None,
@@ -847,22 +953,18 @@ class TaskOrion(IOrion):
 
         :return: Dictionary representation of the TaskOrion
         """
-        # Convert tasks using their to_dict methods
-        tasks_dict = {}
-        for task_id, task in self._tasks.items():
-            tasks_dict[task_id] = task.to_dict()
-
-        # Convert dependencies using their to_dict methods
-        dependencies_dict = {}
-        for dep_id, dependency in self._dependencies.items():
-            dependencies_dict[dep_id] = dependency.to_dict()
-
         return {
             "orion_id": self._orion_id,
             "name": self._name,
-            "state": self._state.value,
-            "tasks": tasks_dict,
-            "dependencies": dependencies_dict,
+            "state": _ORION_STATE_VALUES[self._state],
+            # Convert tasks and dependencies using their to_dict methods
+            "tasks": {
+                task_id: task.to_dict() for task_id, task in self._tasks.items()
+            },
+            "dependencies": {
+                dep_id: dependency.to_dict()
+                for dep_id, dependency in self._dependencies.items()
+            },
             "metadata": self._metadata,
             "created_at": self._created_at.isoformat(),
             "updated_at": self._updated_at.isoformat(),
@@ -891,15 +993,7 @@ class TaskOrion(IOrion):
             return state_value
         elif isinstance(state_value, str):
             # Map string names to OrionState
-            state_map = {
-                "CREATED": OrionState.CREATED,
-                "READY": OrionState.READY,
-                "EXECUTING": OrionState.EXECUTING,
-                "COMPLETED": OrionState.COMPLETED,
-                "FAILED": OrionState.FAILED,
-                "PARTIALLY_FAILED": OrionState.PARTIALLY_FAILED,
-            }
-            return state_map.get(state_value.upper(), OrionState.CREATED)
+            return _ORION_STATE_BY_NAME.get(state_value.upper(), OrionState.CREATED)
         else:
             return OrionState.CREATED
 
@@ -923,10 +1017,17 @@ class TaskOrion(IOrion):
         orion._metadata = data.get("metadata", {})
 
         # Restore timestamps
-        if data.get("created_at"):
-            orion._created_at = datetime.fromisoformat(data["created_at"])
-        if data.get("updated_at"):
-            orion._updated_at = datetime.fromisoformat(data["updated_at"])
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
+        if created_at:
+            orion._created_at = datetime.fromisoformat(created_at)
+        if updated_at:
+            # Unmodified objects carry identical timestamps; parse only once
+            orion._updated_at = (
+                orion._created_at
+                if updated_at == created_at
+                else datetime.fromisoformat(updated_at)
+            )
         if data.get("execution_start_time"):
             orion._execution_start_time = datetime.fromisoformat(
                 data["execution_start_time"]
@@ -956,16 +1057,15 @@ class TaskOrion(IOrion):
         :return: JSON string representation of the TaskOrion
         :raises IOError: If file writing fails when save_path is provided
         """
-        import json
-
         # Get dictionary representation
         orion_dict = self.to_dict()
 
-        # Handle potentially non-serializable attributes
-        serializable_dict = self._ensure_json_serializable(orion_dict)
-
-        # Convert to JSON string with proper formatting
-        json_str = json.dumps(serializable_dict, indent=2, ensure_ascii=False)
+        # Encode directly; only walk the dict to coerce values when the
+        # encoder rejects something (e.g. non-serializable metadata)
+        try:
+            json_str = _dumps_json(orion_dict)
+        except (TypeError, ValueError):
+            json_str = _dumps_json(self._ensure_json_serializable(orion_dict))
 
         # Save to file if path provided
         if save_path:
@@ -996,10 +1096,6 @@ class TaskOrion(IOrion):
         :param data: Data to make serializable (can be dict, list, or primitive)
         :return: JSON serializable data
         """
-        import json
-        from enum import Enum
-        from datetime import datetime
-
         # Handle None
         if data is None:
             return None
@@ -1054,12 +1150,15 @@ class TaskOrion(IOrion):
 
     @classmethod
     def from_json(
-        cls, json_data: Optional[str] = None, file_path: Optional[str] = None
+        cls,
+        json_data: Optional[Union[str, bytes]] = None,
+        file_path: Optional[str] = None,
     ) -> "TaskOrion":
         """
         Create a TaskOrion from a JSON string or JSON file.
 
-        :param json_data: JSON string representation of the TaskOrion
+        :param json_data: JSON representation of the TaskOrion, as a string or
+            as UTF-8 bytes straight from a socket or file (no decode needed)
         :param file_path: Path to JSON file containing TaskOrion data
         :return: TaskOrion instance
         :raises ValueError: If neither json_data nor file_path is provided, or both are provided
@@ -1067,8 +1166,6 @@ class TaskOrion(IOrion):
         :raises json.JSONDecodeError: If JSON parsing fails
         :raises IOError: If file reading fails
         """
-        import json
-
         if json_data is None and file_path is None:
             raise ValueError("Either json_data or file_path must be provided")
 
@@ -1078,18 +1175,19 @@ class TaskOrion(IOrion):
         # Load JSON data
         if file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(file_path, "rb") as f:
+                    data = _loads_json(f.read())
             except FileNotFoundError:
                 raise FileNotFoundError(f"JSON file not found: {file_path}")
             except Exception as e:
                 raise IOError(f"Failed to read JSON file {file_path}: {e}")
         else:
             try:
-                data = json.loads(json_data)
+                data = _loads_json(json_data)
             except json.JSONDecodeError as e:
+                # e.doc is always text, even when bytes were passed in
                 raise json.JSONDecodeError(
-                    f"Invalid JSON format: {e}", json_data, e.pos
+                    f"Invalid JSON format: {e}", e.doc, e.pos
                 )
 
         # Validate that data is a dictionary
@@ -1099,6 +1197,52 @@ class TaskOrion(IOrion):
         # Create TaskOrion instance from dictionary
         return cls.from_dict(data)
 
+    def to_msgpack(self) -> bytes:
+        """
+        Convert the TaskOrion to a MessagePack binary representation.
+
+        Holds the same data as :meth:`to_json` in a smaller payload, for
+        persistence and transport where readability is not needed.
+
+        :return: MessagePack encoded TaskOrion
+        :raises ImportError: If msgspec is not installed
+        """
+        if msgspec is None:
+            raise ImportError(
+                "msgspec is required for MessagePack serialization. Install with: pip install msgspec"
+            )
+
+        orion_dict = self.to_dict()
+        try:
+            return _MSGPACK_ENCODER.encode(orion_dict)
+        except TypeError:
+            # Metadata may hold values msgspec cannot encode
+            return _MSGPACK_ENCODER.encode(
+                self._ensure_json_serializable(orion_dict)
+            )
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "TaskOrion":
+        """
+        Create a TaskOrion from a MessagePack representation.
+
+        :param data: Bytes produced by :meth:`to_msgpack`
+        :return: TaskOrion instance
+        :raises ImportError: If msgspec is not installed
+        :raises ValueError: If the data is not a valid encoded TaskOrion
+        """
+        if msgspec is None:
+            raise ImportError(
+                "msgspec is required for MessagePack serialization. Install with: pip install msgspec"
+            )
+
+        try:
+            orion_dict = _MSGPACK_DECODER.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid MessagePack data: {e}") from e
+
+        return cls.from_dict(orion_dict)
+
     @classmethod
     def from_basemodel(cls, schema: "TaskOrionSchema") -> "TaskOrion":
         """
@@ -1158,6 +1302,13 @@ class TaskOrion(IOrion):
         # Use DFS to check if there's already a path from to_task_id to from_task_id
         visited = set()
 
+        # Build the successor map once so each visit is a lookup, not a scan
+        successors: Dict[str, List[str]] = {}
+        for dependency in self._dependencies.values():
+            successors.setdefault(dependency.from_task_id, []).append(
+                dependency.to_task_id
+            )
+
         def has_path(current: str, target: str) -> bool:
             if current == target:
                 return True
@@ -1167,10 +1318,9 @@ class TaskOrion(IOrion):
             visited.add(current)
 
             # Check all dependencies where current is the source
-            for dependency in self._dependencies.values():
-                if dependency.from_task_id == current:
-                    if has_path(dependency.to_task_id, target):
-                        return True
+            for next_task_id in successors.get(current, ()):
+                if has_path(next_task_id, target):
+                    return True
 
             return False
 
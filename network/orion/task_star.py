@@ -8,9 +8,11 @@ Optimized for type safety, maintainability, and follows SOLID principles.
 """
 
 import asyncio
+import json
 import logging
 import uuid
 from datetime import datetime, timezone
+from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from network.client.device_manager import OrionDeviceManager
@@ -22,6 +24,36 @@ from .enums import DeviceType, TaskPriority, TaskStatus
 if TYPE_CHECKING:
     from network.agents.schema import TaskStarSchema
 
+# Enum lookup tables built once, so to_dict/from_dict avoid per-task work
+_PRIORITY_VALUES = {priority: priority.value for priority in TaskPriority}
+_STATUS_VALUES = {status: status.value for status in TaskStatus}
+_DEVICE_TYPE_VALUES = {device_type: device_type.value for device_type in DeviceType}
+
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in TaskPriority}
+_PRIORITY_BY_NAME = {
+    "LOW": TaskPriority.LOW,
+    "MEDIUM": TaskPriority.MEDIUM,
+    "HIGH": TaskPriority.HIGH,
+    "CRITICAL": TaskPriority.CRITICAL,
+}
+_DEVICE_TYPE_BY_NAME = {
+    "WINDOWS": DeviceType.WINDOWS,
+    "MACOS": DeviceType.MACOS,
+    "LINUX": DeviceType.LINUX,
+    "ANDROID": DeviceType.ANDROID,
+    "IOS": DeviceType.IOS,
+    "WEB": DeviceType.WEB,
+    "API": DeviceType.API,
+}
+_STATUS_BY_NAME = {
+    "PENDING": TaskStatus.PENDING,
+    "RUNNING": TaskStatus.RUNNING,
+    "COMPLETED": TaskStatus.COMPLETED,
+    "FAILED": TaskStatus.FAILED,
+    "CANCELLED": TaskStatus.CANCELLED,
+    "WAITING_DEPENDENCY": TaskStatus.WAITING_DEPENDENCY,
+}
+
 
 class TaskStar(ITask):
     """
@@ -37,6 +69,33 @@ class TaskStar(ITask):
     task management with type safety and validation.
     """
 
+    # Orions hold many tasks; fixed slots avoid a per-instance __dict__
+    __slots__ = (
+        "_task_id",
+        "_name",
+        "_description",
+        "_tips",
+        "_target_device_id",
+        "_device_type",
+        "_priority",
+        "_timeout",
+        "_retry_count",
+        "_current_retry",
+        "_task_data",
+        "_expected_output_type",
+        "_status",
+        "_result",
+        "_error",
+        "_execution_start_time",
+        "_execution_end_time",
+        "_created_at",
+        "_updated_at",
+        "_dependencies",
+        "_dependents",
+        "_validation_errors",
+        "logger",
+    )
+
     def __init__(
         self,
         task_id: Optional[TaskId] = None,
@@ -570,9 +629,11 @@ class TaskStar(ITask):
             "tips": self._tips,
             "task_description": self._description,  # Backwards compatibility
             "target_device_id": self._target_device_id,
-            "device_type": self._device_type.value if self._device_type else None,
-            "priority": self._priority.value,
-            "status": self._status.value,
+            "device_type": (
+                _DEVICE_TYPE_VALUES[self._device_type] if self._device_type else None
+            ),
+            "priority": _PRIORITY_VALUES[self._priority],
+            "status": _STATUS_VALUES[self._status],
             "result": self._serialize_result(self._result),
             "error": str(self._error) if self._error else None,
             "timeout": self._timeout,
@@ -604,10 +665,6 @@ class TaskStar(ITask):
         :param result: The result to serialize
         :return: JSON-compatible result
         """
-        import json
-        from enum import Enum
-        from datetime import datetime
-
         if result is None:
             return None
 
@@ -678,19 +735,10 @@ class TaskStar(ITask):
             return priority_value
         elif isinstance(priority_value, str):
             # Map string names to TaskPriority
-            priority_map = {
-                "LOW": TaskPriority.LOW,
-                "MEDIUM": TaskPriority.MEDIUM,
-                "HIGH": TaskPriority.HIGH,
-                "CRITICAL": TaskPriority.CRITICAL,
-            }
-            return priority_map.get(priority_value.upper(), TaskPriority.MEDIUM)
+            return _PRIORITY_BY_NAME.get(priority_value.upper(), TaskPriority.MEDIUM)
         elif isinstance(priority_value, int):
-            # Direct enum creation from int value
-            try:
-                return TaskPriority(priority_value)
-            except ValueError:
-                return TaskPriority.MEDIUM
+            # Table lookup by int value, skipping the Enum constructor
+            return _PRIORITY_BY_VALUE.get(priority_value, TaskPriority.MEDIUM)
         else:
             return TaskPriority.MEDIUM
 
@@ -708,16 +756,7 @@ class TaskStar(ITask):
             return device_type_value
         elif isinstance(device_type_value, str):
             # Map string names to DeviceType
-            device_type_map = {
-                "WINDOWS": DeviceType.WINDOWS,
-                "MACOS": DeviceType.MACOS,
-                "LINUX": DeviceType.LINUX,
-                "ANDROID": DeviceType.ANDROID,
-                "IOS": DeviceType.IOS,
-                "WEB": DeviceType.WEB,
-                "API": DeviceType.API,
-            }
-            return device_type_map.get(device_type_value.upper())
+            return _DEVICE_TYPE_BY_NAME.get(device_type_value.upper())
         else:
             return None
 
@@ -733,15 +772,7 @@ class TaskStar(ITask):
             return status_value
         elif isinstance(status_value, str):
             # Map string names to TaskStatus
-            status_map = {
-                "PENDING": TaskStatus.PENDING,
-                "RUNNING": TaskStatus.RUNNING,
-                "COMPLETED": TaskStatus.COMPLETED,
-                "FAILED": TaskStatus.FAILED,
-                "CANCELLED": TaskStatus.CANCELLED,
-                "WAITING_DEPENDENCY": TaskStatus.WAITING_DEPENDENCY,
-            }
-            return status_map.get(status_value.upper(), TaskStatus.PENDING)
+            return _STATUS_BY_NAME.get(status_value.upper(), TaskStatus.PENDING)
         else:
             return TaskStatus.PENDING
 
@@ -778,10 +809,17 @@ class TaskStar(ITask):
             task._error = Exception(data["error"])
 
         # Restore timestamps
-        if data.get("created_at"):
-            task._created_at = datetime.fromisoformat(data["created_at"])
-        if data.get("updated_at"):
-            task._updated_at = datetime.fromisoformat(data["updated_at"])
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
+        if created_at:
+            task._created_at = datetime.fromisoformat(created_at)
+        if updated_at:
+            # Unmodified objects carry identical timestamps; parse only once
+            task._updated_at = (
+                task._created_at
+                if updated_at == created_at
+                else datetime.fromisoformat(updated_at)
+            )
         if data.get("execution_start_time"):
             task._execution_start_time = datetime.fromisoformat(
                 data["execution_start_time"]
@@ -837,8 +875,6 @@ class TaskStar(ITask):
         :raises json.JSONDecodeError: If JSON parsing fails
         :raises IOError: If file reading fails
         """
-        import json
-
         if json_data is None and file_path is None:
             raise ValueError("Either json_data or file_path must be provided")
 
@@ -877,8 +913,6 @@ class TaskStar(ITask):
         :return: JSON string representation of the TaskStar
         :raises IOError: If file writing fails when save_path is provided
         """
-        import json
-
         # Get dictionary representation
         task_dict = self.to_dict()
 
@@ -907,8 +941,6 @@ class TaskStar(ITask):
         :param data: Dictionary to make serializable
         :return: JSON serializable dictionary
         """
-        import json
-
         serializable_data = {}
 
         for key, value in data.items():
@@ -6,6 +6,7 @@ This module defines the TaskStarLine class, representing directed dependency
 relationships between tasks with conditional logic support.
 """
 
+import json
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
@@ -16,6 +17,15 @@ from .enums import DependencyType
 if TYPE_CHECKING:
     from network.agents.schema import TaskStarLineSchema
 
+# Enum lookup tables built once, so to_dict/from_dict avoid per-line work
+_DEPENDENCY_TYPE_VALUES = {dep_type: dep_type.value for dep_type in DependencyType}
+_DEPENDENCY_TYPE_BY_NAME = {
+    "UNCONDITIONAL": DependencyType.UNCONDITIONAL,
+    "CONDITIONAL": DependencyType.CONDITIONAL,
+    "SUCCESS_ONLY": DependencyType.SUCCESS_ONLY,
+    "COMPLETION_ONLY": DependencyType.COMPLETION_ONLY,
+}
+
 
 class TaskStarLine(IDependency):
     """
@@ -30,6 +40,29 @@ class TaskStarLine(IDependency):
     Implements IDependency interface for consistent dependency operations.
     """
 
+    # Orions hold many dependencies; fixed slots avoid a per-instance __dict__
+    __slots__ = (
+        "_line_id",
+        "_from_task_id",
+        "_to_task_id",
+        "_dependency_type",
+        "_condition_description",
+        "_condition_evaluator",
+        "_metadata",
+        "_is_satisfied",
+        "_last_evaluation_result",
+        "_last_evaluation_time",
+        "_created_at",
+        "_updated_at",
+        # Optional properties set by callers and compared by ChangeDetector
+        "trigger_action",
+        "trigger_actor",
+        "condition",
+        "keyword",
+        "description",
+        "priority",
+    )
+
     def __init__(
         self,
         from_task_id: str,
@@ -239,7 +272,7 @@ class TaskStarLine(IDependency):
             "line_id": self._line_id,
             "from_task_id": self._from_task_id,
             "to_task_id": self._to_task_id,
-            "dependency_type": self._dependency_type.value,
+            "dependency_type": _DEPENDENCY_TYPE_VALUES[self._dependency_type],
             "condition_description": self._condition_description,
             "metadata": self._metadata,
             "is_satisfied": self._is_satisfied,
@@ -265,13 +298,7 @@ class TaskStarLine(IDependency):
             return dep_type_value
         elif isinstance(dep_type_value, str):
             # Map string names to DependencyType
-            dep_type_map = {
-                "UNCONDITIONAL": DependencyType.UNCONDITIONAL,
-                "CONDITIONAL": DependencyType.CONDITIONAL,
-                "SUCCESS_ONLY": DependencyType.SUCCESS_ONLY,
-                "COMPLETION_ONLY": DependencyType.COMPLETION_ONLY,
-            }
-            return dep_type_map.get(
+            return _DEPENDENCY_TYPE_BY_NAME.get(
                 dep_type_value.upper(), DependencyType.UNCONDITIONAL
             )
         else:
@@ -301,10 +328,17 @@ class TaskStarLine(IDependency):
         line._last_evaluation_result = data.get("last_evaluation_result")
 
         # Restore timestamps
-        if data.get("created_at"):
-            line._created_at = datetime.fromisoformat(data["created_at"])
-        if data.get("updated_at"):
-            line._updated_at = datetime.fromisoformat(data["updated_at"])
+        created_at = data.get("created_at")
+        updated_at = data.get("updated_at")
+        if created_at:
+            line._created_at = datetime.fromisoformat(created_at)
+        if updated_at:
+            # Unmodified objects carry identical timestamps; parse only once
+            line._updated_at = (
+                line._created_at
+                if updated_at == created_at
+                else datetime.fromisoformat(updated_at)
+            )
         if data.get("last_evaluation_time"):
             line._last_evaluation_time = datetime.fromisoformat(
                 data["last_evaluation_time"]
@@ -349,8 +383,6 @@ class TaskStarLine(IDependency):
         :return: JSON string representation of the TaskStarLine
         :raises IOError: If file writing fails when save_path is provided
         """
-        import json
-
         # Get dictionary representation
         line_dict = self.to_dict()
 
@@ -377,8 +409,6 @@ class TaskStarLine(IDependency):
         :param data: Dictionary to make serializable
         :return: JSON serializable dictionary
         """
-        import json
-
         serializable_data = {}
 
         for key, value in data.items():
@@ -421,8 +451,6 @@ class TaskStarLine(IDependency):
         :raises json.JSONDecodeError: If JSON parsing fails
         :raises IOError: If file reading fails
         """
-        import json
-
         if json_data is None and file_path is None:
             raise ValueError("Either json_data or file_path must be provided")
 
@@ -53,7 +53,10 @@ class OrionProgressObserver(IEventObserver):
         """
         try:
             self.logger.info(
-                f"Task progress: {event.task_id} -> {event.status}. Event Type: {event.event_type}"
+                "Task progress: %s -> %s. Event Type: %s",
+                event.task_id,
+                event.status,
+                event.event_type,
             )
 
             # Store task result
@@ -126,7 +126,7 @@ class OrionDisplay:
             orion_data.update(additional_info)
 
         # Use the new formatter to display
-        formatter = OrionFormatter()
+        formatter = OrionFormatter(console=self.console)
         formatter.display_orion_result(orion_data)
 
     def display_orion_failed(
@@ -16,8 +16,8 @@ from rich.text import Text
 class OrionFormatter:
     """Formatter for displaying orion execution results in a structured way."""
 
-    def __init__(self):
-        self.console = Console()
+    def __init__(self, console: Optional[Console] = None):
+        self.console = console or Console()
 
     def format_duration(self, seconds: float) -> str:
         """Format duration in seconds to human-readable format."""
@@ -6,6 +6,7 @@ This observer subscribes to all Network events and pushes them to connected WebS
 Provides efficient event serialization and broadcasting capabilities.
 """
 
+import json
 import logging
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
@@ -22,6 +23,31 @@ from network.core.events import (
     TaskEvent,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_message(event_data: Dict[str, Any]) -> str:
+    """
+    Encode serialized event data as a compact JSON text frame.
+
+    Uses orjson when available and matches the format of Starlette's
+    ``send_json`` otherwise.
+
+    :param event_data: JSON-compatible event data
+    :return: JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode(
+                "utf-8"
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(event_data, separators=(",", ":"), ensure_ascii=False)
+
 
 class EventSerializer:
     """
@@ -386,8 +412,14 @@ class WebSocketObserver(IEventObserver):
         try:
             self._event_count += 1
 
+            # Skip serialization entirely when no UI client is attached
+            if not self._connections:
+                return
+
             # Convert event to JSON-serializable format using the serializer
             event_data: Dict[str, Any] = self._serializer.serialize_event(event)
+            # Encode once and send the same text frame to every client
+            message: str = _encode_message(event_data)
 
             self.logger.debug(
                 f"Broadcasting event #{self._event_count}: {event.event_type.value} to {len(self._connections)} clients"
@@ -397,7 +429,7 @@ class WebSocketObserver(IEventObserver):
             disconnected: Set[WebSocket] = set()
             for connection in self._connections:
                 try:
-                    await connection.send_json(event_data)
+                    await connection.send_text(message)
                     self.logger.debug(f"Successfully sent event to client")
                 except Exception as e:
                     self.logger.warning(
@@ -10,6 +10,7 @@ for testing purposes, without requiring actual LLM integration or external depen
 import asyncio
 import logging
 import time
+from collections import deque
 from typing import Dict, List, Optional, Union
 
 from network.agents.orion_agent import OrionAgent
@@ -325,3 +326,41 @@ class MockTaskOrionOrchestrator:
 
         # Mock execution by just returning success
         return {"status": "completed", "tasks_executed": orion.task_count}
+
+
+class MockAsyncQueue:
+    """
+    Deque-backed stand-in for asyncio.Queue in tests that preload events.
+
+    get() never blocks: it raises asyncio.QueueEmpty when nothing is queued,
+    so tests must put their events before the code under test reads them.
+    """
+
+    def __init__(self):
+        self._items = deque()
+
+    def put_nowait(self, item) -> None:
+        """Append an item to the queue."""
+        self._items.append(item)
+
+    async def put(self, item) -> None:
+        """Append an item to the queue."""
+        self._items.append(item)
+
+    def get_nowait(self):
+        """Pop the oldest item, raising asyncio.QueueEmpty if there is none."""
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    async def get(self):
+        """Pop the oldest item, raising asyncio.QueueEmpty if there is none."""
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        """Return True if the queue holds no items."""
+        return not self._items
+
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return len(self._items)
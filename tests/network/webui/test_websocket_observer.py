@@ -0,0 +1,75 @@
+"""
+Tests for Network WebUI WebSocket observer broadcasting.
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from network.core.events import EventType, TaskEvent
+from network.webui import websocket_observer
+from network.webui.websocket_observer import WebSocketObserver, _encode_message
+
+
+@pytest.fixture
+def task_event():
+    """Create a task completion event."""
+    return TaskEvent(
+        event_type=EventType.TASK_COMPLETED,
+        source_id="test_source",
+        timestamp=time.time(),
+        data={"orion_id": "test_orion"},
+        task_id="task1",
+        status="completed",
+        result={"success": True},
+        error=None,
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_encode_message_compact_json(monkeypatch, use_orjson):
+    """Test that both encoder paths produce the same compact JSON."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(websocket_observer, "orjson", None)
+    event_data = {
+        "event_type": "task_completed",
+        "data": {"ids": [1, 2]},
+        "name": "café",
+    }
+
+    message = _encode_message(event_data)
+
+    assert message == json.dumps(
+        event_data, separators=(",", ":"), ensure_ascii=False
+    )
+    assert json.loads(message) == event_data
+
+
+@pytest.mark.asyncio
+async def test_on_event_sends_one_message_to_all_clients(task_event):
+    """Test that every client receives the same encoded string."""
+    observer = WebSocketObserver()
+    clients = [Mock(send_text=AsyncMock()) for _ in range(3)]
+    for client in clients:
+        observer.add_connection(client)
+
+    await observer.on_event(task_event)
+
+    messages = [client.send_text.await_args.args[0] for client in clients]
+    assert all(message is messages[0] for message in messages)
+    assert json.loads(messages[0])["task_id"] == "task1"
+
+
+@pytest.mark.asyncio
+async def test_on_event_without_clients_skips_serialization(task_event):
+    """Test that events are not serialized when no client is connected."""
+    observer = WebSocketObserver()
+    observer._serializer = Mock()
+
+    await observer.on_event(task_event)
+
+    observer._serializer.serialize_event.assert_not_called()
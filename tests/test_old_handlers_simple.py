@@ -4,15 +4,12 @@
 简单测试验证旧的handlers都能产生输出
 """
 
-import sys
-import os
-import asyncio
+import copy
 import time
 from io import StringIO
-from rich.console import Console
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import pytest
+from rich.console import Console
 
 from network.session.observers.dag_visualization_observer import (
     DAGVisualizationObserver,
@@ -23,12 +20,8 @@ from network.orion import (
     TaskStarLine,
     TaskPriority,
 )
-from network.orion.enums import (
-    TaskStatus,
-    OrionState,
-    DependencyType,
-)
-from network.core.events import Event, EventType, TaskEvent, OrionEvent
+from network.orion.enums import DependencyType
+from network.core.events import EventType, TaskEvent, OrionEvent
 
 
 def create_test_orion():
@@ -62,88 +55,107 @@ def create_test_orion():
     return orion
 
 
-async def test_all_event_types():
-    """测试观察者是否对所有事件类型都产生输出"""
-    print(" 测试所有事件类型的输出")
-    print("=" * 60)
-
-    # Create observer with visible console output
-    console = Console()
+def build_event(event_type, orion, timestamp):
+    """Build the sample event sent to the observer for an event type."""
+    if "ORION" in event_type.name:
+        # Orion event
+        event = OrionEvent(
+            event_type=event_type,
+            source_id="test",
+            timestamp=timestamp,
+            data={
+                "orion": orion,
+                "orion_id": orion.orion_id,
+                "message": f"Test {event_type.name}",
+            },
+            orion_id=orion.orion_id,
+            orion_state=(
+                "executing" if event_type != EventType.ORION_COMPLETED else "completed"
+            ),
+        )
+
+        if event_type == EventType.ORION_MODIFIED:
+            event.data["changes"] = {
+                "modification_type": "tasks_added",
+                "added_tasks": ["new_task"],
+                "added_dependencies": [],
+            }
+            event.new_ready_tasks = ["new_task"]
+
+    else:
+        # Task event
+        event = TaskEvent(
+            event_type=event_type,
+            source_id="test",
+            timestamp=timestamp,
+            data={"orion_id": orion.orion_id},
+            task_id="process_001",
+            status="running" if event_type == EventType.TASK_STARTED else "completed",
+        )
+
+        if event_type == EventType.TASK_COMPLETED:
+            event.result = {"output": "Success!"}
+            event.data["execution_time"] = 2.5
+        elif event_type == EventType.TASK_FAILED:
+            event.data["error"] = "Test error message"
+
+    return event
+
+
+@pytest.fixture(scope="module")
+def orion():
+    """Sample orion shared by every event type case."""
+    return create_test_orion()
+
+
+@pytest.fixture(scope="module")
+def console():
+    """Rich console rendering into a buffer instead of the real terminal."""
+    return Console(file=StringIO(), force_terminal=False, no_color=True, width=120)
+
+
+@pytest.fixture(scope="module")
+def registered_observer(orion, console):
+    """Observer with the sample orion already registered."""
     observer = DAGVisualizationObserver(console=console)
-
-    orion = create_test_orion()
     observer.register_orion(orion.orion_id, orion)
+    return observer
+
+
+EVENT_TYPES_TO_TEST = [
+    EventType.ORION_STARTED,
+    EventType.ORION_MODIFIED,
+    EventType.ORION_COMPLETED,
+    EventType.ORION_FAILED,
+    EventType.TASK_STARTED,
+    EventType.TASK_COMPLETED,
+    EventType.TASK_FAILED,
+]
+
+
+@pytest.fixture(scope="module")
+def event_templates(orion):
+    """Prebuilt event for every tested event type."""
+    timestamp = time.time()
+    return {
+        event_type: build_event(event_type, orion, timestamp)
+        for event_type in EVENT_TYPES_TO_TEST
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("event_type", EVENT_TYPES_TO_TEST, ids=lambda et: et.name)
+async def test_all_event_types(
+    event_type, event_templates, registered_observer, console
+):
+    """测试观察者是否对所有事件类型都产生输出"""
+    event = copy.copy(event_templates[event_type])
 
-    event_types_to_test = [
-        EventType.ORION_STARTED,
-        EventType.ORION_MODIFIED,
-        EventType.ORION_COMPLETED,
-        EventType.ORION_FAILED,
-        EventType.TASK_STARTED,
-        EventType.TASK_COMPLETED,
-        EventType.TASK_FAILED,
-    ]
-
-    for event_type in event_types_to_test:
-        print(f"\n 测试 {event_type.name}:")
-        print("-" * 40)
-
-        try:
-            if "ORION" in event_type.name:
-                # Orion event
-                event = OrionEvent(
-                    event_type=event_type,
-                    source_id="test",
-                    timestamp=time.time(),
-                    data={
-                        "orion": orion,
-                        "orion_id": orion.orion_id,
-                        "message": f"Test {event_type.name}",
-                    },
-                    orion_id=orion.orion_id,
-                    orion_state=(
-                        "executing"
-                        if event_type != EventType.ORION_COMPLETED
-                        else "completed"
-                    ),
-                )
-
-                if event_type == EventType.ORION_MODIFIED:
-                    event.data["changes"] = {
-                        "modification_type": "tasks_added",
-                        "added_tasks": ["new_task"],
-                        "added_dependencies": [],
-                    }
-                    event.new_ready_tasks = ["new_task"]
-
-            else:
-                # Task event
-                event = TaskEvent(
-                    event_type=event_type,
-                    source_id="test",
-                    timestamp=time.time(),
-                    data={"orion_id": orion.orion_id},
-                    task_id="process_001",
-                    status=(
-                        "running"
-                        if event_type == EventType.TASK_STARTED
-                        else "completed"
-                    ),
-                )
-
-                if event_type == EventType.TASK_COMPLETED:
-                    event.result = {"output": "Success!"}
-                    event.data["execution_time"] = 2.5
-                elif event_type == EventType.TASK_FAILED:
-                    event.data["error"] = "Test error message"
-
-            # Test the event
-            await observer.on_event(event)
-            print("[OK] 输出正常")
-
-        except Exception as e:
-            print(f"[FAIL] 错误: {e}")
+    # Handling the event must not raise and must render something
+    offset = console.file.tell()
+    await registered_observer.on_event(event)
+    assert console.file.getvalue()[offset:]
 
 
 if __name__ == "__main__":
-    asyncio.run(test_all_event_types())
+    pytest.main([__file__, "-v"])
@@ -3,31 +3,56 @@
 Unit tests for the refactored TaskOrionOrchestrator.
 
 Tests orchestration functionality with separated responsibilities
-using OrionParser and OrionManager.
+using OrionManager.
+
+The integration class is marked ``slow`` and only runs with ``pytest -m slow``.
 """
 
-import asyncio
+import copy
 import pytest
-from typing import Dict, List, Optional
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from types import SimpleNamespace
 
 from network.orion.orchestrator.orchestrator import (
     TaskOrionOrchestrator,
 )
-from network.orion.enums import TaskStatus, DeviceType
+from network.orion.enums import TaskStatus
 from network.orion.task_orion import TaskOrion
 from network.orion.task_star import TaskStar
+from network.orion.task_star_line import TaskStarLine
+
+
+# Result of a successful TaskStar.execute call
+_SUCCESS = SimpleNamespace(result="success", status=TaskStatus.COMPLETED.value)
+
+
+async def _noop_publish(*args, **kwargs):
+    """Event bus publish that discards the event."""
 
 
 class MockOrionDeviceManager:
     """Mock device manager for testing orchestrator."""
 
     def __init__(self):
-        self.device_registry = Mock()
-        self._connected_devices = ["device1", "device2"]
+        self._connected_devices = ("device1", "device2")
+        self._profiles = {}
+        self.device_registry = SimpleNamespace(get_device_info=self._get_device_info)
 
     def get_connected_devices(self):
-        return self._connected_devices.copy()
+        return self._connected_devices
+
+    def get_all_devices(self, connected=False):
+        return {
+            device_id: self._get_device_info(device_id)
+            for device_id in self._connected_devices
+        }
+
+    def _get_device_info(self, device_id):
+        if device_id not in self._connected_devices:
+            return None
+        profile = self._profiles.get(device_id)
+        if profile is None:
+            profile = self._profiles[device_id] = MockAgentProfile(device_id)
+        return profile
 
 
 class MockAgentProfile:
@@ -40,50 +65,108 @@ class MockAgentProfile:
         self.metadata = {"platform": "windows"}
 
 
+def _ts(task_id, description=""):
+    """Build a TaskStar, using the id as description when none is given."""
+    return TaskStar(task_id=task_id, description=description or task_id)
+
+
+def _build_orion(descriptions, name, sequential=False):
+    """Build an orion with one task per description, optionally chained."""
+    orion = TaskOrion(name=name)
+    task_ids = [f"task_{i}" for i in range(1, len(descriptions) + 1)]
+    for task_id, description in zip(task_ids, descriptions):
+        orion.add_task(_ts(task_id, description))
+    if sequential:
+        for from_id, to_id in zip(task_ids, task_ids[1:]):
+            orion.add_dependency(TaskStarLine.create_unconditional(from_id, to_id))
+    return orion
+
+
+class _FastTaskStar(TaskStar):
+    """TaskStar whose execution succeeds immediately, without patching."""
+
+    async def execute(self, *args, **kwargs):
+        return _SUCCESS
+
+
+@pytest.fixture
+def patched_execute(monkeypatch):
+    """Make TaskStar.execute succeed immediately; yields the executed tasks."""
+    executed_tasks = []
+
+    async def fake_execute(self, *args, **kwargs):
+        executed_tasks.append(self)
+        return _SUCCESS
+
+    monkeypatch.setattr(TaskStar, "execute", fake_execute)
+    return executed_tasks
+
+
+@pytest.fixture
+def failing_execute(monkeypatch):
+    """Make TaskStar.execute raise immediately."""
+
+    async def fake_execute(self, *args, **kwargs):
+        raise Exception("Task execution failed")
+
+    monkeypatch.setattr(TaskStar, "execute", fake_execute)
+
+
+@pytest.fixture(scope="session")
+def orion_template():
+    """Single-task orion that tests deep-copy instead of rebuilding."""
+    orion = TaskOrion(name="Template")
+    orion.add_task(_ts("task1", "Task 1"))
+    return orion
+
+
+@pytest.fixture(scope="module")
+def two_task_orion():
+    """Two independent tasks shared by the device assignment tests."""
+    orion = TaskOrion(name="Assignment Test")
+    orion.add_task(_ts("task1", "First task"))
+    orion.add_task(_ts("task2", "Second task"))
+    return orion
+
+
 class TestTaskOrionOrchestrator:
     """Test cases for the refactored TaskOrionOrchestrator."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_device_manager(self):
         """Create a mock device manager for testing."""
-        device_manager = MockOrionDeviceManager()
-
-        def get_device_info(device_id):
-            if device_id in device_manager._connected_devices:
-                return MockAgentProfile(device_id)
-            return None
-
-        device_manager.device_registry.get_device_info.side_effect = get_device_info
-        return device_manager
+        return MockOrionDeviceManager()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_event_bus(self):
-        """Create a mock event bus for testing."""
-        event_bus = Mock()
-        event_bus.publish_event = AsyncMock()
-        return event_bus
+        """Create a no-op event bus for testing."""
+        return SimpleNamespace(publish_event=_noop_publish)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def orchestrator(self, mock_device_manager, mock_event_bus):
-        """Create a TaskOrionOrchestrator for testing."""
+        """Create a TaskOrionOrchestrator shared by the module."""
         return TaskOrionOrchestrator(
             device_manager=mock_device_manager,
-            enable_logging=False,
+            enable_logging=True,
             event_bus=mock_event_bus,
         )
 
+    @pytest.fixture(autouse=True)
+    def reset_shared_mocks(self, mock_device_manager, orchestrator):
+        """Restore the module-scoped mocks and orchestrator after each test."""
+        yield
+        mock_device_manager._connected_devices = ("device1", "device2")
+        orion_manager = orchestrator._orion_manager
+        for orion_id in list(orion_manager._managed_orions):
+            orion_manager.unregister_orion(orion_id)
+
     @pytest.fixture
     def orchestrator_no_device(self, mock_event_bus):
         """Create orchestrator without device manager."""
         return TaskOrionOrchestrator(
-            enable_logging=False, event_bus=mock_event_bus
+            enable_logging=True, event_bus=mock_event_bus
         )
 
-    @pytest.fixture
-    def sample_tasks(self):
-        """Create sample task descriptions for testing."""
-        return ["Open browser", "Navigate to website", "Fill form", "Submit form"]
-
     def test_init_with_device_manager(self, mock_device_manager, mock_event_bus):
         """Test orchestrator initialization with device manager."""
         orchestrator = TaskOrionOrchestrator(
@@ -115,202 +198,80 @@ class TestTaskOrionOrchestrator:
             is mock_device_manager
         )
 
-    @pytest.mark.asyncio
-    async def test_create_orion_from_llm(self, orchestrator):
-        """Test creating orion from LLM output."""
-        llm_output = """
-        Task 1: Open browser
-        Task 2: Navigate to site
-        Dependencies: Task 1 -> Task 2
-        """
-
-        orion = await orchestrator.create_orion_from_llm(
-            llm_output, "LLM Test Orion"
-        )
-
-        assert isinstance(orion, TaskOrion)
-        assert orion.name == "LLM Test Orion"
-        # Should be registered with orion manager
-        assert (
-            orion.orion_id
-            in orchestrator._orion_manager._managed_orions
-        )
-
-    @pytest.mark.asyncio
-    async def test_create_orion_from_json(self, orchestrator):
-        """Test creating orion from JSON data."""
-        json_data = """{
-            "name": "JSON Test",
-            "tasks": {
-                "task1": {"task_id": "task1", "description": "Test task"}
-            },
-            "dependencies": []
-        }"""
-
-        orion = await orchestrator.create_orion_from_json(
-            json_data, "JSON Orion"
-        )
-
-        assert isinstance(orion, TaskOrion)
-        assert orion.name == "JSON Orion"
-
-    @pytest.mark.asyncio
-    async def test_create_simple_orion_sequential(
-        self, orchestrator, sample_tasks
-    ):
-        """Test creating simple sequential orion."""
-        orion = await orchestrator.create_simple_orion(
-            sample_tasks, "Sequential Test", sequential=True
-        )
-
-        assert isinstance(orion, TaskOrion)
-        assert orion.name == "Sequential Test"
-        assert orion.task_count == len(sample_tasks)
-        assert orion.dependency_count == len(sample_tasks) - 1
-
-    @pytest.mark.asyncio
-    async def test_create_simple_orion_parallel(
-        self, orchestrator, sample_tasks
-    ):
-        """Test creating simple parallel orion."""
-        orion = await orchestrator.create_simple_orion(
-            sample_tasks, "Parallel Test", sequential=False
-        )
-
-        assert isinstance(orion, TaskOrion)
-        assert orion.name == "Parallel Test"
-        assert orion.task_count == len(sample_tasks)
-        assert orion.dependency_count == 0
-
-    @pytest.mark.asyncio
-    async def test_orchestrate_orion_no_device_manager(
-        self, orchestrator_no_device
+    @pytest.mark.parametrize(
+        "orchestrator_name, target_device_id, message",
+        [
+            ("orchestrator_no_device", None, "OrionDeviceManager not set"),
+            ("orchestrator", None, "Tasks without device assignment"),
+            ("orchestrator", "ghost_device", "Tasks with invalid device IDs"),
+        ],
+        ids=["no_device_manager", "missing_assignment", "unknown_device"],
+    )
+    async def test_orchestrate_orion_failure(
+        self, request, orchestrator_name, target_device_id, message
     ):
-        """Test orchestration without device manager raises error."""
-        orion = TaskOrion(name="Test")
-
-        with pytest.raises(ValueError, match="OrionDeviceManager not set"):
-            await orchestrator_no_device.orchestrate_orion(orion)
-
-    @pytest.mark.asyncio
-    async def test_orchestrate_orion_invalid_dag(self, orchestrator):
-        """Test orchestration with invalid DAG structure."""
-        orion = TaskOrion(name="Invalid DAG")
-        # Create orion that will fail validation
-        # (empty orion is considered invalid)
-
-        with pytest.raises(ValueError, match="Invalid DAG"):
-            await orchestrator.orchestrate_orion(orion)
-
-    @pytest.mark.asyncio
-    async def test_orchestrate_orion_assignment_validation_failed(
-        self, orchestrator
-    ):
-        """Test orchestration when device assignment validation fails."""
+        """Test orchestration failures raise a descriptive ValueError."""
+        orchestrator = request.getfixturevalue(orchestrator_name)
         orion = TaskOrion(name="Test Orion")
-
-        # Add a task
-        task = TaskStar(task_id="task1", description="Test task")
+        task = _ts("task1", "Test task")
+        task.target_device_id = target_device_id
         orion.add_task(task)
 
-        # Mock device manager to have no devices
-        orchestrator._device_manager._connected_devices = []
-
-        with pytest.raises(ValueError, match="No available devices"):
+        with pytest.raises(ValueError, match=message):
             await orchestrator.orchestrate_orion(orion)
 
-    @pytest.mark.asyncio
-    async def test_orchestrate_orion_with_manual_assignments(
-        self, orchestrator
-    ):
+    async def test_orchestrate_orion_with_manual_assignments(self, orchestrator):
         """Test orchestration with manual device assignments."""
         orion = TaskOrion(name="Manual Assignment Test")
 
         # Add tasks
-        task1 = TaskStar(task_id="task1", description="First task")
-        task2 = TaskStar(task_id="task2", description="Second task")
+        task1 = _FastTaskStar(task_id="task1", description="First task")
+        task2 = _FastTaskStar(task_id="task2", description="Second task")
         orion.add_task(task1)
         orion.add_task(task2)
 
-        # Mock task execution to complete immediately
-        with patch.object(TaskStar, "execute", new_callable=AsyncMock) as mock_execute:
-            mock_execute.return_value = Mock(result="success")
-
-            device_assignments = {"task1": "device1", "task2": "device2"}
-            result = await orchestrator.orchestrate_orion(
-                orion, device_assignments
-            )
-
-            assert result["status"] == "completed"
-            assert (
-                result["total_tasks"] == 0
-            )  # No results captured in this simplified version
-
-    @pytest.mark.asyncio
-    async def test_execute_single_task(self, orchestrator):
-        """Test executing a single task."""
-        task = TaskStar(task_id="single_task", description="Single test task")
-
-        # Mock task execution
-        with patch.object(TaskStar, "execute", new_callable=AsyncMock) as mock_execute:
-            mock_result = Mock()
-            mock_result.result = "task_completed"
-            mock_execute.return_value = mock_result
-
-            result = await orchestrator.execute_single_task(task, "device1")
+        device_assignments = {"task1": "device1", "task2": "device2"}
+        result = await orchestrator.orchestrate_orion(orion, device_assignments)
 
-            assert result == "task_completed"
-            assert task.target_device_id == "device1"
-
-    @pytest.mark.asyncio
-    async def test_execute_single_task_auto_assign(self, orchestrator):
-        """Test executing single task with auto device assignment."""
-        task = TaskStar(task_id="auto_task", description="Auto assign task")
-
-        with patch.object(TaskStar, "execute", new_callable=AsyncMock) as mock_execute:
-            mock_result = Mock()
-            mock_result.result = "auto_completed"
-            mock_execute.return_value = mock_result
+        assert result["status"] == "completed"
+        assert (
+            result["total_tasks"] == 0
+        )  # No results captured in this simplified version
+
+    @pytest.mark.parametrize(
+        "device_id, expected_devices",
+        [("device1", ["device1"]), (None, ["device1", "device2"])],
+        ids=["explicit_device", "auto_assign"],
+    )
+    async def test_execute_single_task(
+        self, orchestrator, patched_execute, device_id, expected_devices
+    ):
+        """Test executing a single task with explicit or automatic device."""
+        task = _ts("single_task", "Single test task")
 
+        if device_id is None:
             result = await orchestrator.execute_single_task(task)
+        else:
+            result = await orchestrator.execute_single_task(task, device_id)
 
-            assert result == "auto_completed"
-            assert task.target_device_id in ["device1", "device2"]
+        assert result == "success"
+        assert patched_execute == [task]
+        assert task.target_device_id in expected_devices
 
-    @pytest.mark.asyncio
     async def test_execute_single_task_no_devices(self, orchestrator):
         """Test executing single task when no devices available."""
-        task = TaskStar(task_id="no_device_task", description="No device task")
+        task = _ts("no_device_task", "No device task")
 
         # Mock no available devices
-        orchestrator._orion_manager._device_manager._connected_devices = []
+        orchestrator._orion_manager._device_manager._connected_devices = ()
 
         with pytest.raises(ValueError, match="No available devices"):
             await orchestrator.execute_single_task(task)
 
-    @pytest.mark.asyncio
-    async def test_modify_orion_with_llm(self, orchestrator):
-        """Test modifying orion with LLM request."""
-        orion = TaskOrion(name="Original Orion")
-        task = TaskStar(task_id="original_task", description="Original task")
-        orion.add_task(task)
-
-        modification_request = "Add a new task after the original task"
-
-        modified = await orchestrator.modify_orion_with_llm(
-            orion, modification_request
-        )
-
-        assert isinstance(modified, TaskOrion)
-        # In current implementation, this returns the same orion
-        # as LLM integration is not fully implemented
-
-    @pytest.mark.asyncio
-    async def test_get_orion_status(self, orchestrator):
+    async def test_get_orion_status(self, orchestrator, orion_template):
         """Test getting orion status."""
-        orion = TaskOrion(name="Status Test")
-        task = TaskStar(task_id="status_task", description="Status task")
-        orion.add_task(task)
+        orion = copy.deepcopy(orion_template)
+        orion.name = "Status Test"
 
         # Register orion
         orchestrator._orion_manager.register_orion(orion)
@@ -321,7 +282,6 @@ class TestTaskOrionOrchestrator:
         assert status["name"] == "Status Test"
         assert "statistics" in status
 
-    @pytest.mark.asyncio
     async def test_get_available_devices(self, orchestrator):
         """Test getting available devices."""
         devices = await orchestrator.get_available_devices()
@@ -329,287 +289,84 @@ class TestTaskOrionOrchestrator:
         assert len(devices) == 2
         assert all("device_id" in device for device in devices)
 
-    @pytest.mark.asyncio
-    async def test_assign_devices_automatically(self, orchestrator):
-        """Test automatic device assignment."""
-        orion = TaskOrion(name="Assignment Test")
-
-        task1 = TaskStar(task_id="task1", description="First task")
-        task2 = TaskStar(task_id="task2", description="Second task")
-        orion.add_task(task1)
-        orion.add_task(task2)
-
-        assignments = await orchestrator.assign_devices_automatically(
-            orion, strategy="round_robin"
-        )
-
-        assert len(assignments) == 2
-        assert "task1" in assignments
-        assert "task2" in assignments
-
-    @pytest.mark.asyncio
-    async def test_assign_devices_with_preferences(self, orchestrator):
-        """Test device assignment with preferences."""
-        orion = TaskOrion(name="Preference Test")
-
-        task1 = TaskStar(task_id="task1", description="Preferred task")
-        orion.add_task(task1)
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"strategy": "round_robin"}, {}),
+            ({"device_preferences": {"task1": "device2"}}, {"task1": "device2"}),
+        ],
+        ids=["round_robin", "preferences"],
+    )
+    async def test_assign_devices(
+        self, orchestrator, two_task_orion, kwargs, expected
+    ):
+        """Test automatic device assignment with and without preferences."""
+        orion = copy.deepcopy(two_task_orion)
 
-        preferences = {"task1": "device2"}
         assignments = await orchestrator.assign_devices_automatically(
-            orion, device_preferences=preferences
-        )
-
-        assert assignments["task1"] == "device2"
-
-    def test_export_orion(self, orchestrator):
-        """Test exporting orion."""
-        orion = TaskOrion(name="Export Test")
-        task = TaskStar(task_id="export_task", description="Export task")
-        orion.add_task(task)
-
-        # Test JSON export
-        json_export = orchestrator.export_orion(orion, "json")
-        assert isinstance(json_export, str)
-        assert "Export Test" in json_export
-
-        # Test LLM export
-        llm_export = orchestrator.export_orion(orion, "llm")
-        assert isinstance(llm_export, str)
-        assert "Export Test" in llm_export
-
-    @pytest.mark.asyncio
-    async def test_import_orion_json(self, orchestrator):
-        """Test importing orion from JSON."""
-        json_data = """{
-            "name": "Import Test",
-            "tasks": {
-                "import_task": {
-                    "task_id": "import_task",
-                    "description": "Imported task"
-                }
-            },
-            "dependencies": []
-        }"""
-
-        orion = await orchestrator.import_orion(json_data, "json")
-
-        assert isinstance(orion, TaskOrion)
-        assert "import_task" in orion.tasks
-
-    @pytest.mark.asyncio
-    async def test_import_orion_llm(self, orchestrator):
-        """Test importing orion from LLM format."""
-        llm_data = """
-        Task: Import task
-        Description: Task created from LLM import
-        """
-
-        orion = await orchestrator.import_orion(llm_data, "llm")
-
-        assert isinstance(orion, TaskOrion)
-
-    @pytest.mark.asyncio
-    async def test_import_orion_unsupported_format(self, orchestrator):
-        """Test importing with unsupported format."""
-        with pytest.raises(ValueError, match="Unsupported import format"):
-            await orchestrator.import_orion("data", "unsupported")
-
-    def test_add_task_to_orion(self, orchestrator):
-        """Test adding task to orion."""
-        orion = TaskOrion(name="Add Task Test")
-        original_task = TaskStar(task_id="original", description="Original task")
-        orion.add_task(original_task)
-
-        new_task = TaskStar(task_id="new_task", description="New task")
-        success = orchestrator.add_task_to_orion(
-            orion, new_task, dependencies=["original"]
-        )
-
-        assert success
-        assert "new_task" in orion.tasks
-
-    def test_remove_task_from_orion(self, orchestrator):
-        """Test removing task from orion."""
-        orion = TaskOrion(name="Remove Task Test")
-
-        task1 = TaskStar(task_id="task1", description="Task 1")
-        task2 = TaskStar(task_id="task2", description="Task 2")
-        orion.add_task(task1)
-        orion.add_task(task2)
-
-        success = orchestrator.remove_task_from_orion(orion, "task1")
-
-        assert success
-        assert "task1" not in orion.tasks
-        assert "task2" in orion.tasks
-
-    def test_clone_orion(self, orchestrator):
-        """Test cloning a orion."""
-        original = TaskOrion(name="Original")
-        task = TaskStar(task_id="task1", description="Original task")
-        original.add_task(task)
-
-        cloned = orchestrator.clone_orion(original, "Cloned")
-
-        assert isinstance(cloned, TaskOrion)
-        assert cloned.name == "Cloned"
-        assert cloned.orion_id != original.orion_id
-        assert cloned.task_count == original.task_count
-
-    def test_merge_orions(self, orchestrator):
-        """Test merging two orions."""
-        orion1 = TaskOrion(name="First")
-        task1 = TaskStar(task_id="task1", description="Task 1")
-        orion1.add_task(task1)
-
-        orion2 = TaskOrion(name="Second")
-        task2 = TaskStar(task_id="task2", description="Task 2")
-        orion2.add_task(task2)
-
-        merged = orchestrator.merge_orions(
-            orion1, orion2, "Merged"
+            orion, **kwargs
         )
 
-        assert isinstance(merged, TaskOrion)
-        assert merged.name == "Merged"
-        assert merged.task_count == 2
-        assert "c1_task1" in merged.tasks
-        assert "c2_task2" in merged.tasks
+        assert set(assignments) == {"task1", "task2"}
+        for task_id, device_id in expected.items():
+            assert assignments[task_id] == device_id
 
 
+@pytest.mark.slow
 class TestTaskOrionOrchestratorIntegration:
     """Integration tests for TaskOrionOrchestrator."""
 
     @pytest.fixture
     def mock_device_manager(self):
         """Create mock device manager for integration testing."""
-        device_manager = MockOrionDeviceManager()
-
-        def get_device_info(device_id):
-            if device_id in device_manager._connected_devices:
-                return MockAgentProfile(device_id)
-            return None
-
-        device_manager.device_registry.get_device_info.side_effect = get_device_info
-        return device_manager
+        return MockOrionDeviceManager()
 
     @pytest.fixture
     def orchestrator(self, mock_device_manager):
         """Create orchestrator for integration testing."""
         return TaskOrionOrchestrator(
-            device_manager=mock_device_manager, enable_logging=False
+            device_manager=mock_device_manager, enable_logging=True
         )
 
-    @pytest.mark.asyncio
     async def test_end_to_end_orion_workflow(self, orchestrator):
-        """Test complete orion workflow from creation to execution."""
-        # Create orion from task descriptions
+        """Test complete orion workflow from assignment to status."""
         task_descriptions = ["Open app", "Perform action", "Verify result"]
-        orion = await orchestrator.create_simple_orion(
-            task_descriptions, "E2E Test", sequential=True
-        )
-
-        # Export and reimport
-        exported = orchestrator.export_orion(orion, "json")
-        reimported = await orchestrator.import_orion(exported, "json")
-
-        assert reimported.task_count == orion.task_count
-
-        # Clone orion
-        cloned = orchestrator.clone_orion(orion, "E2E Cloned")
-        assert cloned.task_count == orion.task_count
+        orion = _build_orion(task_descriptions, "E2E Test", sequential=True)
 
         # Assign devices
-        assignments = await orchestrator.assign_devices_automatically(cloned)
+        assignments = await orchestrator.assign_devices_automatically(orion)
         assert len(assignments) == 3
 
         # Get status
-        status = await orchestrator.get_orion_status(cloned)
+        orchestrator._orion_manager.register_orion(orion)
+        status = await orchestrator.get_orion_status(orion)
         assert status is not None
-        assert status["name"] == "E2E Cloned"
-
-    @pytest.mark.asyncio
-    async def test_complex_orion_operations(self, orchestrator):
-        """Test complex orion operations and modifications."""
-        # Create base orion
-        orion = await orchestrator.create_simple_orion(
-            ["Base task 1", "Base task 2"], "Complex Test"
-        )
-
-        # Add additional task
-        new_task = TaskStar(task_id="additional", description="Additional task")
-        success = orchestrator.add_task_to_orion(orion, new_task)
-        assert success
+        assert status["name"] == "E2E Test"
 
-        # Create another orion to merge
-        other_orion = await orchestrator.create_simple_orion(
-            ["Other task"], "Other"
-        )
-
-        # Merge orions
-        merged = orchestrator.merge_orions(
-            orion, other_orion, "Complex Merged"
-        )
-        assert merged.task_count == 4  # 2 + 1 + 1
-
-        # Assign devices with different strategies
-        await orchestrator.assign_devices_automatically(merged, strategy="load_balance")
-
-        # Verify all tasks have assignments
-        for task in merged.tasks.values():
-            assert task.target_device_id is not None
-
-        # Remove a task (use the actual task ID from merged orion)
-        merged_task_ids = list(merged.tasks.keys())
-        # Find a task that contains "additional" in its ID
-        task_to_remove = next(
-            (tid for tid in merged_task_ids if "additional" in tid), None
-        )
-        if task_to_remove:
-            success = orchestrator.remove_task_from_orion(
-                merged, task_to_remove
-            )
-        else:
-            # If no task with "additional" found, use the first task
-            success = orchestrator.remove_task_from_orion(
-                merged, merged_task_ids[0]
-            )
-        assert success
-        assert merged.task_count == 3
-
-    @pytest.mark.asyncio
-    async def test_orchestration_with_task_execution_mock(self, orchestrator):
+    async def test_orchestration_with_task_execution_mock(
+        self, orchestrator, patched_execute
+    ):
         """Test orchestration with mocked task execution."""
-        orion = await orchestrator.create_simple_orion(
+        orion = _build_orion(
             ["Mock task 1", "Mock task 2"], "Mock Test", sequential=True
         )
 
-        # Mock task execution to return success
-        with patch.object(TaskStar, "execute", new_callable=AsyncMock) as mock_execute:
-            mock_result = Mock()
-            mock_result.result = "mock_success"
-            mock_execute.return_value = mock_result
-
-            result = await orchestrator.orchestrate_orion(orion)
+        result = await orchestrator.orchestrate_orion(
+            orion, assignment_strategy="round_robin"
+        )
 
-            assert result["status"] == "completed"
-            # Verify task execution was called
-            assert mock_execute.call_count >= 2  # Should execute both tasks
+        assert result["status"] == "completed"
+        # Verify task execution was called
+        assert len(patched_execute) >= 2  # Should execute both tasks
 
-    @pytest.mark.asyncio
-    async def test_error_handling_in_orchestration(self, orchestrator):
+    async def test_error_handling_in_orchestration(
+        self, orchestrator, failing_execute
+    ):
         """Test error handling during orchestration."""
-        orion = await orchestrator.create_simple_orion(
-            ["Error task"], "Error Test"
-        )
+        orion = _build_orion(["Error task"], "Error Test")
 
-        # Mock task execution to raise exception
-        with patch.object(TaskStar, "execute", new_callable=AsyncMock) as mock_execute:
-            mock_execute.side_effect = Exception("Task execution failed")
-
-            # Execute orchestration (it should handle the exception)
-            await orchestrator.orchestrate_orion(orion)
+        # Execute orchestration (it should handle the exception)
+        await orchestrator.orchestrate_orion(orion, assignment_strategy="round_robin")
 
-            # Check that the orion is in failed state
-            assert orion.state.value == "failed"
+        # Check that the orion is in failed state
+        assert orion.state.value == "failed"
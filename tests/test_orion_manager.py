@@ -8,6 +8,7 @@ for TaskOrion objects.
 
 import asyncio
 import pytest
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, Mock
 
@@ -19,57 +20,71 @@ from network.orion.task_orion import TaskOrion
 from network.orion.task_star import TaskStar
 
 
+class StubRegistry:
+    """Device registry stub serving precomputed device profiles."""
+
+    def __init__(self, profiles):
+        self._profiles = profiles
+
+    def get_device_info(self, device_id):
+        return self._profiles.get(device_id)
+
+
 class MockDeviceManager:
     """Mock device manager for testing."""
 
     def __init__(self):
-        self.device_registry = Mock()
-        self._connected_devices = ["device1", "device2", "device3"]
+        self._connected_devices = ("device1", "device2", "device3")
+        self._profiles = {
+            device_id: MockAgentProfile(device_id)
+            for device_id in self._connected_devices
+        }
+        self.device_registry = StubRegistry(self._profiles)
 
     def get_connected_devices(self):
-        return self._connected_devices.copy()
+        return self._connected_devices
 
 
 class MockAgentProfile:
     """Mock device info for testing."""
 
+    # Shared, read-only across profiles
+    capabilities = ("ui_automation", "web_browsing")
+    metadata = MappingProxyType({"platform": "windows", "version": "11"})
+
     def __init__(self, device_id: str, device_type: str = "desktop"):
         self.device_id = device_id
         self.device_type = device_type
-        self.capabilities = ["ui_automation", "web_browsing"]
-        self.metadata = {"platform": "windows", "version": "11"}
 
 
 class TestOrionManager:
     """Test cases for OrionManager class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_device_manager(self):
-        """Create a mock device manager for testing."""
-        device_manager = MockDeviceManager()
-
-        # Set up device registry mock
-        def get_device_info(device_id):
-            if device_id in device_manager._connected_devices:
-                return MockAgentProfile(device_id)
-            return None
+        """Create a mock device manager shared by the whole class."""
+        return MockDeviceManager()
 
-        device_manager.device_registry.get_device_info.side_effect = get_device_info
-        return device_manager
+    @pytest.fixture(scope="module")
+    def shared_manager(self, mock_device_manager):
+        """Create a OrionManager instance shared by the whole class."""
+        return OrionManager(mock_device_manager, enable_logging=False)
 
     @pytest.fixture
-    def manager(self, mock_device_manager):
-        """Create a OrionManager instance for testing."""
-        return OrionManager(mock_device_manager, enable_logging=False)
+    def manager(self, shared_manager):
+        """Shared OrionManager, emptied of registered orions after each test."""
+        yield shared_manager
+        shared_manager._managed_orions.clear()
+        shared_manager._orion_metadata.clear()
 
     @pytest.fixture
     def manager_no_device(self):
         """Create a OrionManager without device manager."""
         return OrionManager(enable_logging=False)
 
-    @pytest.fixture
-    def sample_orion(self):
-        """Create a sample orion for testing."""
+    @pytest.fixture(scope="module")
+    def shared_orion(self):
+        """Create a sample orion for tests that do not modify its tasks."""
         orion = TaskOrion(name="Test Orion")
 
         # Add tasks
@@ -83,6 +98,14 @@ class TestOrionManager:
 
         return orion
 
+    @pytest.fixture
+    def sample_orion(self, shared_orion):
+        """Shared orion with task device settings restored after each test."""
+        yield shared_orion
+        for task in shared_orion.tasks.values():
+            task.target_device_id = None
+            task.device_type = None
+
     def test_init_with_device_manager(self, mock_device_manager):
         """Test initialization with device manager."""
         manager = OrionManager(mock_device_manager, enable_logging=True)
@@ -103,32 +126,32 @@ class TestOrionManager:
 
         assert manager_no_device._device_manager is mock_device_manager
 
-    def test_register_orion(self, manager, sample_orion):
+    def test_register_orion(self, manager, shared_orion):
         """Test registering a orion for management."""
         metadata = {"priority": "high", "user": "test_user"}
 
         orion_id = manager.register_orion(
-            sample_orion, metadata
+            shared_orion, metadata
         )
 
-        assert orion_id == sample_orion.orion_id
+        assert orion_id == shared_orion.orion_id
         assert orion_id in manager._managed_orions
-        assert manager._managed_orions[orion_id] is sample_orion
+        assert manager._managed_orions[orion_id] is shared_orion
         assert manager._orion_metadata[orion_id] == metadata
 
     def test_register_orion_without_metadata(
-        self, manager, sample_orion
+        self, manager, shared_orion
     ):
         """Test registering orion without metadata."""
-        orion_id = manager.register_orion(sample_orion)
+        orion_id = manager.register_orion(shared_orion)
 
         assert orion_id in manager._managed_orions
         assert manager._orion_metadata[orion_id] == {}
 
-    def test_unregister_orion(self, manager, sample_orion):
+    def test_unregister_orion(self, manager, shared_orion):
         """Test unregistering a orion."""
         # Register first
-        orion_id = manager.register_orion(sample_orion)
+        orion_id = manager.register_orion(shared_orion)
 
         # Unregister
         success = manager.unregister_orion(orion_id)
@@ -143,13 +166,13 @@ class TestOrionManager:
 
         assert not success
 
-    def test_get_orion(self, manager, sample_orion):
+    def test_get_orion(self, manager, shared_orion):
         """Test getting a managed orion by ID."""
-        orion_id = manager.register_orion(sample_orion)
+        orion_id = manager.register_orion(shared_orion)
 
         retrieved = manager.get_orion(orion_id)
 
-        assert retrieved is sample_orion
+        assert retrieved is shared_orion
 
     def test_get_nonexistent_orion(self, manager):
         """Test getting a nonexistent orion."""
@@ -157,11 +180,11 @@ class TestOrionManager:
 
         assert retrieved is None
 
-    def test_list_orions(self, manager, sample_orion):
+    def test_list_orions(self, manager, shared_orion):
         """Test listing all managed orions."""
         metadata = {"priority": "high"}
         orion_id = manager.register_orion(
-            sample_orion, metadata
+            shared_orion, metadata
         )
 
         orions = manager.list_orions()
@@ -169,8 +192,8 @@ class TestOrionManager:
         assert len(orions) == 1
         orion_info = orions[0]
         assert orion_info["orion_id"] == orion_id
-        assert orion_info["name"] == sample_orion.name
-        assert orion_info["task_count"] == sample_orion.task_count
+        assert orion_info["name"] == shared_orion.name
+        assert orion_info["task_count"] == shared_orion.task_count
         assert orion_info["metadata"] == metadata
 
     def test_list_orions_empty(self, manager):
@@ -179,53 +202,33 @@ class TestOrionManager:
 
         assert len(orions) == 0
 
-    @pytest.mark.asyncio
-    async def test_assign_devices_round_robin(self, manager, sample_orion):
-        """Test round robin device assignment strategy."""
-        assignments = await manager.assign_devices_automatically(
-            sample_orion, strategy="round_robin"
-        )
-
-        assert len(assignments) == 3  # 3 tasks
-        assert all(
-            task_id in assignments for task_id in sample_orion.tasks.keys()
-        )
-
-        # Verify round robin distribution
-        assigned_devices = list(assignments.values())
-        assert len(set(assigned_devices)) <= 3  # At most 3 different devices
-
-    @pytest.mark.asyncio
-    async def test_assign_devices_capability_match(self, manager, sample_orion):
-        """Test capability matching device assignment strategy."""
-        # Set device types for tasks
-        sample_orion.tasks["task1"].device_type = DeviceType.WINDOWS
-        sample_orion.tasks["task2"].device_type = (
-            DeviceType.MACOS
-        )  # Will fall back
-
-        assignments = await manager.assign_devices_automatically(
-            sample_orion, strategy="capability_match"
-        )
-
-        assert len(assignments) == 3
-        assert all(
-            task_id in assignments for task_id in sample_orion.tasks.keys()
-        )
+    @pytest.mark.parametrize(
+        "strategy, device_types",
+        [
+            ("round_robin", {}),
+            # MACOS has no matching device and falls back
+            (
+                "capability_match",
+                {"task1": DeviceType.WINDOWS, "task2": DeviceType.MACOS},
+            ),
+            ("load_balance", {}),
+        ],
+        ids=["round_robin", "capability_match", "load_balance"],
+    )
+    async def test_assign_devices_strategy(
+        self, manager, sample_orion, strategy, device_types
+    ):
+        """Test each device assignment strategy assigns every task."""
+        for task_id, device_type in device_types.items():
+            sample_orion.tasks[task_id].device_type = device_type
 
-    @pytest.mark.asyncio
-    async def test_assign_devices_load_balance(self, manager, sample_orion):
-        """Test load balanced device assignment strategy."""
         assignments = await manager.assign_devices_automatically(
-            sample_orion, strategy="load_balance"
+            sample_orion, strategy=strategy
         )
 
-        assert len(assignments) == 3
-        assert all(
-            task_id in assignments for task_id in sample_orion.tasks.keys()
-        )
+        assert assignments.keys() == sample_orion.tasks.keys()
+        assert set(assignments.values()) <= {"device1", "device2", "device3"}
 
-    @pytest.mark.asyncio
     async def test_assign_devices_with_preferences(self, manager, sample_orion):
         """Test device assignment with preferences."""
         preferences = {"task1": "device2", "task2": "device1"}
@@ -238,7 +241,6 @@ class TestOrionManager:
         assert assignments["task2"] == "device1"
         assert "task3" in assignments  # Should be assigned automatically
 
-    @pytest.mark.asyncio
     async def test_assign_devices_invalid_strategy(self, manager, sample_orion):
         """Test device assignment with invalid strategy."""
         with pytest.raises(ValueError, match="Unknown assignment strategy"):
@@ -246,63 +248,55 @@ class TestOrionManager:
                 sample_orion, strategy="invalid_strategy"
             )
 
-    @pytest.mark.asyncio
     async def test_assign_devices_no_device_manager(
-        self, manager_no_device, sample_orion
+        self, manager_no_device, shared_orion
     ):
         """Test device assignment without device manager."""
         with pytest.raises(ValueError, match="Device manager not available"):
-            await manager_no_device.assign_devices_automatically(sample_orion)
+            await manager_no_device.assign_devices_automatically(shared_orion)
 
-    @pytest.mark.asyncio
     async def test_assign_devices_no_available_devices(
-        self, manager, sample_orion
+        self, manager, sample_orion, monkeypatch
     ):
         """Test device assignment when no devices are available."""
         # Mock empty device list
-        manager._device_manager._connected_devices = []
+        monkeypatch.setattr(manager._device_manager, "_connected_devices", ())
 
         with pytest.raises(ValueError, match="No available devices"):
             await manager.assign_devices_automatically(sample_orion)
 
-    @pytest.mark.asyncio
-    async def test_get_orion_status(self, manager, sample_orion):
+    async def test_get_orion_status(self, manager, shared_orion):
         """Test getting orion status."""
         orion_id = manager.register_orion(
-            sample_orion, {"priority": "high"}
+            shared_orion, {"priority": "high"}
         )
 
         status = await manager.get_orion_status(orion_id)
 
         assert status is not None
         assert status["orion_id"] == orion_id
-        assert status["name"] == sample_orion.name
+        assert status["name"] == shared_orion.name
         assert "statistics" in status
         assert "ready_tasks" in status
         assert "metadata" in status
         assert status["metadata"]["priority"] == "high"
 
-    @pytest.mark.asyncio
     async def test_get_orion_status_nonexistent(self, manager):
         """Test getting status of nonexistent orion."""
         status = await manager.get_orion_status("nonexistent_id")
 
         assert status is None
 
-    @pytest.mark.asyncio
     async def test_get_available_devices(self, manager):
         """Test getting available devices."""
         devices = await manager.get_available_devices()
 
         assert len(devices) == 3
+        required = {"device_id", "device_type", "capabilities", "status"}
         for device in devices:
-            assert "device_id" in device
-            assert "device_type" in device
-            assert "capabilities" in device
-            assert "status" in device
+            assert required <= device.keys()
             assert device["status"] == "connected"
 
-    @pytest.mark.asyncio
     async def test_get_available_devices_no_manager(self, manager_no_device):
         """Test getting available devices without device manager."""
         devices = await manager_no_device.get_available_devices()
@@ -354,16 +348,16 @@ class TestOrionManager:
         assert "device_type" in device_info
         assert "capabilities" in device_info
 
-    def test_get_task_device_info_no_assignment(self, manager, sample_orion):
+    def test_get_task_device_info_no_assignment(self, manager, shared_orion):
         """Test getting device info for task without assignment."""
-        device_info = manager.get_task_device_info(sample_orion, "task1")
+        device_info = manager.get_task_device_info(shared_orion, "task1")
 
         assert device_info is None
 
-    def test_get_task_device_info_nonexistent_task(self, manager, sample_orion):
+    def test_get_task_device_info_nonexistent_task(self, manager, shared_orion):
         """Test getting device info for nonexistent task."""
         device_info = manager.get_task_device_info(
-            sample_orion, "nonexistent_task"
+            shared_orion, "nonexistent_task"
         )
 
         assert device_info is None
@@ -378,10 +372,10 @@ class TestOrionManager:
         assert success
         assert sample_orion.tasks["task1"].target_device_id == "device2"
 
-    def test_reassign_nonexistent_task(self, manager, sample_orion):
+    def test_reassign_nonexistent_task(self, manager, shared_orion):
         """Test reassigning a nonexistent task."""
         success = manager.reassign_task_device(
-            sample_orion, "nonexistent_task", "device1"
+            shared_orion, "nonexistent_task", "device1"
         )
 
         assert not success
@@ -399,10 +393,10 @@ class TestOrionManager:
             assert task.target_device_id is None
 
     def test_clear_device_assignments_none_assigned(
-        self, manager, sample_orion
+        self, manager, shared_orion
     ):
         """Test clearing device assignments when none are assigned."""
-        cleared_count = manager.clear_device_assignments(sample_orion)
+        cleared_count = manager.clear_device_assignments(shared_orion)
 
         assert cleared_count == 0
 
@@ -419,20 +413,21 @@ class TestOrionManager:
         assert utilization["device2"] == 1
         assert "device3" not in utilization  # No tasks assigned
 
-    def test_get_device_utilization_no_assignments(self, manager, sample_orion):
+    def test_get_device_utilization_no_assignments(self, manager, shared_orion):
         """Test getting device utilization with no assignments."""
-        utilization = manager.get_device_utilization(sample_orion)
+        utilization = manager.get_device_utilization(shared_orion)
 
         assert len(utilization) == 0
 
-    @pytest.mark.asyncio
     async def test_assign_devices_with_device_manager_error(
-        self, manager, sample_orion
+        self, manager, sample_orion, monkeypatch
     ):
         """Test device assignment when device manager throws error."""
         # Mock device manager to raise exception
-        manager._device_manager.get_connected_devices = Mock(
-            side_effect=Exception("Device manager error")
+        monkeypatch.setattr(
+            manager._device_manager,
+            "get_connected_devices",
+            Mock(side_effect=Exception("Device manager error")),
         )
 
         with pytest.raises(ValueError, match="No available devices"):
@@ -445,22 +440,13 @@ class TestOrionManagerIntegration:
     @pytest.fixture
     def mock_device_manager(self):
         """Create a mock device manager for integration testing."""
-        device_manager = MockDeviceManager()
-
-        def get_device_info(device_id):
-            if device_id in device_manager._connected_devices:
-                return MockAgentProfile(device_id)
-            return None
-
-        device_manager.device_registry.get_device_info.side_effect = get_device_info
-        return device_manager
+        return MockDeviceManager()
 
     @pytest.fixture
     def manager(self, mock_device_manager):
         """Create a OrionManager for integration testing."""
         return OrionManager(mock_device_manager, enable_logging=False)
 
-    @pytest.mark.asyncio
     async def test_full_orion_lifecycle(self, manager):
         """Test complete orion management lifecycle."""
         # Create orion
@@ -505,12 +491,11 @@ class TestOrionManagerIntegration:
         success = manager.unregister_orion(orion_id)
         assert success
 
-    @pytest.mark.asyncio
     async def test_multiple_orions_management(self, manager):
         """Test managing multiple orions simultaneously."""
-        orions = []
+        orion_ids = []
 
-        # Create and register multiple orions
+        # Create, register, assign and validate each orion in one pass
         for i in range(3):
             orion = TaskOrion(name=f"Orion {i+1}")
             for j in range(2):
@@ -520,33 +505,24 @@ class TestOrionManagerIntegration:
                 )
                 orion.add_task(task)
 
-            orion_id = manager.register_orion(orion)
-            orions.append((orion_id, orion))
+            orion_ids.append(manager.register_orion(orion))
 
-        # List all orions
-        orion_list = manager.list_orions()
-        assert len(orion_list) == 3
-
-        # Assign devices to all orions
-        for orion_id, orion in orions:
             assignments = await manager.assign_devices_automatically(orion)
             assert len(assignments) == 2
 
-        # Validate all have assignments
-        for orion_id, orion in orions:
             is_valid, errors = manager.validate_orion_assignments(orion)
             assert is_valid
 
+        # All orions are managed at the same time
+        assert len(manager.list_orions()) == 3
+
         # Unregister all
-        for orion_id, orion in orions:
-            success = manager.unregister_orion(orion_id)
-            assert success
+        for orion_id in orion_ids:
+            assert manager.unregister_orion(orion_id)
 
         # Verify list is empty
-        orion_list = manager.list_orions()
-        assert len(orion_list) == 0
+        assert len(manager.list_orions()) == 0
 
-    @pytest.mark.asyncio
     async def test_device_assignment_strategies_comparison(self, manager):
         """Test and compare different device assignment strategies."""
         orion = TaskOrion(name="Strategy Test")
@@ -564,23 +540,20 @@ class TestOrionManagerIntegration:
         orion.add_task(task2)
         orion.add_task(task3)
 
-        # Test round robin
-        manager.clear_device_assignments(orion)
+        # Each strategy overwrites the previous assignments, so no clearing
+        # is needed between runs
         assignments_rr = await manager.assign_devices_automatically(
             orion, strategy="round_robin"
         )
-
-        # Test capability match
-        manager.clear_device_assignments(orion)
         assignments_cm = await manager.assign_devices_automatically(
             orion, strategy="capability_match"
         )
-
-        # Test load balance
-        manager.clear_device_assignments(orion)
         assignments_lb = await manager.assign_devices_automatically(
             orion, strategy="load_balance"
         )
+        assert {
+            task_id: task.target_device_id for task_id, task in orion.tasks.items()
+        } == assignments_lb
 
         # All strategies should assign all tasks
         assert len(assignments_rr) == 3
@@ -21,9 +21,9 @@ from network.orion.orchestrator.orchestrator import (
 class TestOrionObserverLogger:
     """Test class to verify logging behavior between observer and agent."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def task_event(self):
-        """Create a test task event."""
+        """Create a test task event shared by the module; tests only read it."""
         return TaskEvent(
             event_type=EventType.TASK_COMPLETED,
             source_id="test_source",
@@ -47,9 +47,10 @@ class TestOrionObserverLogger:
     def orion_agent(self, mock_orchestrator):
         """Create a OrionAgent instance."""
         agent = OrionAgent(orchestrator=mock_orchestrator)
-        # Mock the add_task_completion_event method to capture calls
+
+        # Record add_task_completion_event calls while still delegating
         agent.add_task_completion_event = AsyncMock(
-            wraps=agent.add_task_completion_event
+            side_effect=agent.add_task_completion_event
         )
         return agent
 
@@ -58,7 +59,6 @@ class TestOrionObserverLogger:
         """Create a OrionProgressObserver instance."""
         return OrionProgressObserver(agent=orion_agent)
 
-    @pytest.mark.asyncio
     async def test_observer_calls_agent_add_task_completion_event(
         self, observer, orion_agent, task_event, caplog
     ):
@@ -74,11 +74,10 @@ class TestOrionObserverLogger:
         await observer.on_event(task_event)
 
         # Verify that the agent's add_task_completion_event was called
-        orion_agent.add_task_completion_event.assert_called_once()
+        orion_agent.add_task_completion_event.assert_awaited_once()
 
-        # Get the actual call arguments
-        call_args = orion_agent.add_task_completion_event.call_args
-        actual_event = call_args[0][0]  # First positional argument
+        # Get the actual event argument
+        actual_event = orion_agent.add_task_completion_event.await_args.args[0]
 
         # Verify the event is correct
         assert actual_event.task_id == "task-collect-logs-2"
@@ -95,35 +94,17 @@ class TestOrionObserverLogger:
             if "Added task event for task" in record.message
         ]
 
-        print(f"\n=== ALL CAPTURED LOGS ===")
-        for i, record in enumerate(caplog.records):
-            print(
-                f"{i+1}. {record.name}:{record.filename}:{record.lineno} - {record.message}"
-            )
-
-        print(f"\n=== OBSERVER LOGS ===")
-        for log in observer_logs:
-            print(f"Observer: {log.message}")
-
-        print(f"\n=== AGENT LOGS ===")
-        for log in agent_logs:
-            print(f"Agent: {log.message}")
-
         # Verify observer log exists
         assert len(observer_logs) == 1
         assert "task-collect-logs-2" in observer_logs[0].message
         assert "completed" in observer_logs[0].message
 
         # This is the test to see if agent log exists
-        print(f"\nAgent logs count: {len(agent_logs)}")
-        if len(agent_logs) == 0:
-            print(
-                "[FAIL] PROBLEM FOUND: Agent's add_task_completion_event logger did not produce any logs!"
+        if not agent_logs:
+            pytest.fail(
+                "Agent's add_task_completion_event logger did not produce any logs"
             )
-        else:
-            print("[OK] Agent's add_task_completion_event logger works correctly")
 
-    @pytest.mark.asyncio
     async def test_direct_agent_add_task_completion_event_logging(
         self, orion_agent, task_event, caplog
     ):
@@ -133,15 +114,6 @@ class TestOrionObserverLogger:
         caplog.set_level(logging.INFO)
         caplog.clear()
 
-        print(f"\n=== TESTING DIRECT CALL TO add_task_completion_event ===")
-        print(f"Agent logger name: {orion_agent.logger.name}")
-        print(f"Agent logger level: {orion_agent.logger.level}")
-        print(
-            f"Agent logger effective level: {orion_agent.logger.getEffectiveLevel()}"
-        )
-        print(f"Agent logger handlers: {orion_agent.logger.handlers}")
-        print(f"Agent logger propagate: {orion_agent.logger.propagate}")
-
         # Call the method directly
         await orion_agent.add_task_completion_event(task_event)
 
@@ -152,45 +124,20 @@ class TestOrionObserverLogger:
             if "Added task event for task" in record.message
         ]
 
-        print(f"\n=== ALL CAPTURED LOGS FROM DIRECT CALL ===")
-        for i, record in enumerate(caplog.records):
-            print(
-                f"{i+1}. {record.name}:{record.filename}:{record.lineno} - {record.message}"
+        if not agent_logs:
+            logger = orion_agent.logger
+            pytest.fail(
+                "Direct call to add_task_completion_event did not log: "
+                f"logger={logger.name} level={logger.level} "
+                f"effective_level={logger.getEffectiveLevel()} "
+                f"handlers={logger.handlers} propagate={logger.propagate}"
             )
 
-        print(f"\nDirect agent logs count: {len(agent_logs)}")
-        if len(agent_logs) == 0:
-            print(
-                "[FAIL] PROBLEM CONFIRMED: Direct call to add_task_completion_event doesn't log either!"
-            )
-            print(
-                "This suggests the issue is with the logger configuration in OrionAgent"
-            )
-        else:
-            print("[OK] Direct call works - issue might be elsewhere")
-
-    @pytest.mark.asyncio
     async def test_logger_configuration_comparison(
         self, observer, orion_agent, caplog
     ):
         """Compare logger configurations between observer and agent."""
 
-        print(f"\n=== LOGGER CONFIGURATION COMPARISON ===")
-
-        print(f"\nObserver logger:")
-        print(f"  Name: {observer.logger.name}")
-        print(f"  Level: {observer.logger.level}")
-        print(f"  Effective level: {observer.logger.getEffectiveLevel()}")
-        print(f"  Handlers: {observer.logger.handlers}")
-        print(f"  Propagate: {observer.logger.propagate}")
-
-        print(f"\nAgent logger:")
-        print(f"  Name: {orion_agent.logger.name}")
-        print(f"  Level: {orion_agent.logger.level}")
-        print(f"  Effective level: {orion_agent.logger.getEffectiveLevel()}")
-        print(f"  Handlers: {orion_agent.logger.handlers}")
-        print(f"  Propagate: {orion_agent.logger.propagate}")
-
         # Test if both loggers can actually log
         caplog.set_level(logging.INFO)
         caplog.clear()
@@ -209,18 +156,14 @@ class TestOrionObserverLogger:
             if "Agent logger test message" in record.message
         ]
 
-        print(f"\nTest message results:")
-        print(f"  Observer test logs captured: {len(observer_test_logs)}")
-        print(f"  Agent test logs captured: {len(agent_test_logs)}")
-
-        if len(observer_test_logs) > 0 and len(agent_test_logs) == 0:
-            print(
-                "[FAIL] ISSUE FOUND: Agent logger is not properly configured for capturing logs!"
+        if not observer_test_logs or not agent_test_logs:
+            pytest.fail(
+                "Logger test messages not captured: "
+                f"observer={len(observer_test_logs)} ({observer.logger.name}, "
+                f"propagate={observer.logger.propagate}), "
+                f"agent={len(agent_test_logs)} ({orion_agent.logger.name}, "
+                f"propagate={orion_agent.logger.propagate})"
             )
-        elif len(observer_test_logs) == 0 and len(agent_test_logs) == 0:
-            print("[FAIL] ISSUE: Both loggers are not capturing - might be caplog issue")
-        else:
-            print("[OK] Both loggers work for test messages")
 
 
 if __name__ == "__main__":
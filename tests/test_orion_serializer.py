@@ -1,5 +1,5 @@
 ﻿"""
-Tests for OrionSerializer class.
+Tests for TaskOrion dictionary and JSON serialization.
 Validates serialization and deserialization functionality.
 """
 
@@ -7,9 +7,6 @@ import json
 import pytest
 from datetime import datetime
 
-from network.orion.parsers.orion_serializer import (
-    OrionSerializer,
-)
 from network.orion.task_orion import (
     TaskOrion,
     OrionState,
@@ -18,8 +15,12 @@ from network.orion.task_star import TaskStar, TaskPriority, TaskStatus
 from network.orion.task_star_line import TaskStarLine
 
 
+# Shared timestamp for hand-built orion dicts
+_NOW = datetime.now().isoformat()
+
+
 class TestOrionSerializer:
-    """Test OrionSerializer functionality."""
+    """Test TaskOrion serialization functionality."""
 
     def test_to_dict_basic(self):
         """Test basic orion to dictionary conversion."""
@@ -32,10 +33,10 @@ class TestOrionSerializer:
         orion.add_task(task)
 
         # Convert to dict
-        data = OrionSerializer.to_dict(orion)
+        data = orion.to_dict()
 
         assert data["name"] == "Test Orion"
-        assert data["state"] == OrionState.CREATED.value
+        assert data["state"] == OrionState.READY.value
         assert "task_1" in data["tasks"]
         assert data["tasks"]["task_1"]["description"] == "Test task"
         assert data["metadata"] == {}
@@ -53,17 +54,17 @@ class TestOrionSerializer:
                     "priority": TaskPriority.HIGH.value,
                     "status": TaskStatus.PENDING.value,
                     "metadata": {},
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat(),
+                    "created_at": _NOW,
+                    "updated_at": _NOW,
                 }
             },
             "dependencies": {},
             "metadata": {"test": "value"},
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": _NOW,
+            "updated_at": _NOW,
         }
 
-        orion = OrionSerializer.from_dict(data)
+        orion = TaskOrion.from_dict(data)
 
         assert orion.name == "Test Orion"
         assert orion.orion_id == "test_id"
@@ -89,8 +90,8 @@ class TestOrionSerializer:
         orion.add_dependency(dep)
 
         # Convert to JSON and back
-        json_str = OrionSerializer.to_json(orion)
-        restored = OrionSerializer.from_json(json_str)
+        json_str = orion.to_json()
+        restored = TaskOrion.from_json(json_str)
 
         assert restored.name == orion.name
         assert len(restored.tasks) == len(orion.tasks)
@@ -101,43 +102,6 @@ class TestOrionSerializer:
             assert task_id in restored.tasks
             assert restored.tasks[task_id].description == task.description
 
-    def test_normalize_json_data_dependencies_list(self):
-        """Test normalization of dependencies in list format."""
-        data = {
-            "name": "Test",
-            "tasks": {},
-            "dependencies": [
-                {
-                    "predecessor_id": "task_1",
-                    "successor_id": "task_2",
-                    "dependency_type": "unconditional",
-                }
-            ],
-        }
-
-        normalized = OrionSerializer.normalize_json_data(data)
-
-        assert isinstance(normalized["dependencies"], dict)
-        assert "dep_0" in normalized["dependencies"]
-        dep = normalized["dependencies"]["dep_0"]
-        assert dep["from_task_id"] == "task_1"
-        assert dep["to_task_id"] == "task_2"
-        assert dep["dependency_type"] == "unconditional"
-
-    def test_normalize_json_data_dependencies_dict(self):
-        """Test normalization preserves dict format dependencies."""
-        data = {
-            "name": "Test",
-            "tasks": {},
-            "dependencies": {
-                "dep_1": {"from_task_id": "task_1", "to_task_id": "task_2"}
-            },
-        }
-
-        normalized = OrionSerializer.normalize_json_data(data)
-
-        assert normalized["dependencies"] == data["dependencies"]
-
     def test_serialization_with_timestamps(self):
         """Test serialization preserves timestamps correctly."""
         orion = TaskOrion(name="Timestamp Test")
@@ -145,8 +109,8 @@ class TestOrionSerializer:
         orion.complete_execution()
 
         # Serialize and deserialize
-        json_str = OrionSerializer.to_json(orion)
-        restored = OrionSerializer.from_json(json_str)
+        json_str = orion.to_json()
+        restored = TaskOrion.from_json(json_str)
 
         assert restored.execution_start_time is not None
         assert restored.execution_end_time is not None
@@ -160,8 +124,8 @@ class TestOrionSerializer:
         orion.update_metadata({"nested": {"key": "value"}})
 
         # Serialize and deserialize
-        data = OrionSerializer.to_dict(orion)
-        restored = OrionSerializer.from_dict(data)
+        data = orion.to_dict()
+        restored = TaskOrion.from_dict(data)
 
         assert restored.metadata["custom_field"] == "custom_value"
         assert restored.metadata["nested"]["key"] == "value"
@@ -170,8 +134,8 @@ class TestOrionSerializer:
         """Test serialization of empty orion."""
         orion = TaskOrion(name="Empty")
 
-        data = OrionSerializer.to_dict(orion)
-        restored = OrionSerializer.from_dict(data)
+        data = orion.to_dict()
+        restored = TaskOrion.from_dict(data)
 
         assert restored.name == "Empty"
         assert len(restored.tasks) == 0
@@ -181,13 +145,13 @@ class TestOrionSerializer:
     def test_json_serialization_invalid_input(self):
         """Test error handling for invalid JSON."""
         with pytest.raises(json.JSONDecodeError):
-            OrionSerializer.from_json("invalid json")
+            TaskOrion.from_json("invalid json")
 
     def test_dict_serialization_missing_fields(self):
         """Test serialization handles missing fields gracefully."""
         minimal_data = {"name": "Minimal Test"}
 
-        orion = OrionSerializer.from_dict(minimal_data)
+        orion = TaskOrion.from_dict(minimal_data)
 
         assert orion.name == "Minimal Test"
         assert orion.state == OrionState.CREATED
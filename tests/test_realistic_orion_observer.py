@@ -7,23 +7,28 @@ import asyncio
 import logging
 import pytest
 import time
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from typing import Dict, Any
 
 from network.session.observers.base_observer import OrionProgressObserver
 from network.agents.orion_agent import OrionAgent
 from network.core.events import TaskEvent, EventType, get_event_bus
-from network.orion.orchestrator.orchestrator import (
-    TaskOrionOrchestrator,
-)
+
+
+class _OrchestratorStub:
+    """Orchestrator stand-in exposing only the coroutines the agent needs."""
+
+    def __init__(self):
+        self.start = AsyncMock()
+        self.stop = AsyncMock()
 
 
 class TestRealisticsOrionObserverLogger:
     """Test class to verify logging behavior in realistic conditions."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def task_event(self):
-        """Create a test task event."""
+        """Create a test task event, shared since no test mutates it."""
         return TaskEvent(
             event_type=EventType.TASK_COMPLETED,
             source_id="test_source",
@@ -37,11 +42,8 @@ class TestRealisticsOrionObserverLogger:
 
     @pytest.fixture
     def mock_orchestrator(self):
-        """Create a mock orchestrator."""
-        orchestrator = Mock(spec=TaskOrionOrchestrator)
-        orchestrator.start = AsyncMock()
-        orchestrator.stop = AsyncMock()
-        return orchestrator
+        """Create a stub orchestrator without spec introspection."""
+        return _OrchestratorStub()
 
     @pytest.mark.asyncio
     async def test_realistic_scenario_with_logging_levels(
@@ -85,15 +87,15 @@ class TestRealisticsOrionObserverLogger:
         # Test the flow
         await observer.on_event(task_event)
 
-        # Check captured logs
-        observer_logs = [
-            record for record in caplog.records if "Task progress:" in record.message
-        ]
-        agent_logs = [
-            record
-            for record in caplog.records
-            if "Added task event for task" in record.message
-        ]
+        # Check captured logs, bucketing observer and agent records in one pass
+        observer_logs = []
+        agent_logs = []
+        for record in caplog.records:
+            message = record.message
+            if "Task progress:" in message:
+                observer_logs.append(record)
+            elif "Added task event for task" in message:
+                agent_logs.append(record)
 
         print(f"\n=== CAPTURED LOGS WITH INFO LEVEL ===")
         for i, record in enumerate(caplog.records):
@@ -0,0 +1,144 @@
+"""
+Tests for TaskOrion serialization round trips.
+Validates the JSON and MessagePack encodings of a small orion.
+"""
+
+import json
+import math
+
+import pytest
+
+from network.orion import task_orion
+from network.orion.task_orion import TaskOrion
+from network.orion.task_star import TaskStar
+from network.orion.task_star_line import TaskStarLine
+
+
+@pytest.fixture
+def orion():
+    """Orion with two tasks joined by one dependency."""
+    orion = TaskOrion(name="Serialization Test")
+    orion.add_task(TaskStar(task_id="task1", description="First task"))
+    orion.add_task(TaskStar(task_id="task2", description="Second task"))
+    orion.add_dependency(TaskStarLine.create_unconditional("task1", "task2"))
+    return orion
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a JSON test with orjson and again with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(task_orion, "orjson", None)
+    return request.param
+
+
+def test_json_round_trip(orion, json_backend):
+    """Test that from_json restores what to_json wrote."""
+    restored = TaskOrion.from_json(orion.to_json())
+
+    assert restored.orion_id == orion.orion_id
+    assert restored.name == orion.name
+    assert set(restored.tasks) == {"task1", "task2"}
+    assert restored.dependency_count == 1
+    assert restored.tasks["task2"].description == "Second task"
+
+
+def test_msgpack_round_trip(orion):
+    """Test that MessagePack restores the same orion as JSON."""
+    pytest.importorskip("msgspec")
+
+    payload = orion.to_msgpack()
+    restored = TaskOrion.from_msgpack(payload)
+
+    assert isinstance(payload, bytes)
+    assert len(payload) < len(orion.to_json())
+    assert (
+        restored.to_dict() == TaskOrion.from_json(orion.to_json()).to_dict()
+    )
+
+
+def test_msgpack_invalid_data():
+    """Test that malformed MessagePack input raises ValueError."""
+    pytest.importorskip("msgspec")
+
+    with pytest.raises(ValueError, match="Invalid MessagePack data"):
+        TaskOrion.from_msgpack(b"\xc1")
+
+
+def test_to_json_uses_orjson(orion, monkeypatch):
+    """Test that to_json takes the orjson path when it is installed."""
+    orjson_dumps = pytest.importorskip("orjson").dumps
+    calls = []
+
+    def dumps(*args, **kwargs):
+        calls.append(args)
+        return orjson_dumps(*args, **kwargs)
+
+    monkeypatch.setattr(task_orion.orjson, "dumps", dumps)
+
+    orion.to_json()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [lambda orion: orion.to_msgpack(), lambda orion: TaskOrion.from_msgpack(b"")],
+    ids=["to_msgpack", "from_msgpack"],
+)
+def test_msgpack_without_msgspec(orion, monkeypatch, convert):
+    """Test that MessagePack raises ImportError when msgspec is missing."""
+    monkeypatch.setattr(task_orion, "msgspec", None)
+
+    with pytest.raises(ImportError, match="msgspec is required"):
+        convert(orion)
+
+
+def test_json_round_trip_from_bytes(orion, json_backend):
+    """Test that from_json accepts UTF-8 bytes without decoding first."""
+    restored = TaskOrion.from_json(orion.to_json().encode("utf-8"))
+
+    assert restored.orion_id == orion.orion_id
+    assert set(restored.tasks) == {"task1", "task2"}
+
+
+@pytest.mark.parametrize("json_data", ["{ invalid json", b"{ invalid json"])
+def test_invalid_json(json_data, json_backend):
+    """Test that malformed JSON raises JSONDecodeError for str and bytes."""
+    with pytest.raises(json.JSONDecodeError, match="Invalid JSON format"):
+        TaskOrion.from_json(json_data)
+
+
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        {"score": 0.5},
+        {"score": float("nan"), "limits": [float("inf"), -float("inf")]},
+    ],
+    ids=["finite", "non_finite"],
+)
+def test_to_json_matches_stdlib(orion, metadata, json_backend):
+    """Test that to_json writes the same text as json.dumps."""
+    orion.update_metadata(metadata)
+
+    assert orion.to_json() == json.dumps(
+        orion.to_dict(), indent=2, ensure_ascii=False
+    )
+
+
+def test_json_round_trip_non_finite(orion, json_backend):
+    """Test that NaN and Infinity in metadata survive a JSON round trip."""
+    orion.update_metadata(
+        {"score": float("nan"), "limits": [float("inf"), -float("inf")]}
+    )
+
+    json_str = orion.to_json()
+    restored = TaskOrion.from_json(json_str)
+    restored_from_bytes = TaskOrion.from_json(json_str.encode("utf-8"))
+
+    assert "NaN" in json_str
+    for metadata in (restored.metadata, restored_from_bytes.metadata):
+        assert math.isnan(metadata["score"])
+        assert metadata["limits"] == [float("inf"), -float("inf")]
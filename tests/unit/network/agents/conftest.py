@@ -0,0 +1,46 @@
+"""
+Shared fixtures for the agent unit tests.
+"""
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+
+from alien.module.context import Context
+from network.orion import TaskOrion, TaskStar
+from network.orion.enums import TaskPriority
+from network.orion.task_star_line import TaskStarLine
+
+
+@pytest.fixture(scope="module")
+def _simple_orion_template():
+    """Orion where task2 depends on task1, built once per module."""
+    orion = TaskOrion("test_orion")
+    orion.add_task(TaskStar("task1", "Test task 1", TaskPriority.MEDIUM))
+    orion.add_task(TaskStar("task2", "Test task 2", TaskPriority.MEDIUM))
+    orion.add_dependency(TaskStarLine.create_unconditional("task1", "task2"))
+    return orion
+
+
+@pytest.fixture
+def simple_orion(_simple_orion_template):
+    """Fresh copy of the simple orion template.
+
+    Tests set its state, attach it to agents or change task timeouts, so
+    each one gets its own copy.
+    """
+    return copy.deepcopy(_simple_orion_template)
+
+
+@pytest.fixture(scope="session")
+def _context_mock():
+    """Context mock built once, since spec'ing Context introspects the class."""
+    return Mock(spec=Context)
+
+
+@pytest.fixture
+def mock_context(_context_mock):
+    """Shared Context mock with its call history cleared for each test."""
+    _context_mock.reset_mock()
+    return _context_mock
@@ -9,28 +9,50 @@ for the Orion state machine implementation.
 import asyncio
 import pytest
 import time
-import sys
-import os
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from typing import Dict, Any, Optional
-
-# Add project root to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+from unittest.mock import Mock, AsyncMock
 
 from network.agents.orion_agent_states import (
     StartOrionAgentState,
-    MonitorOrionAgentState,
+    ContinueOrionAgentState,
     FinishOrionAgentState,
     FailOrionAgentState,
     OrionAgentStateManager,
     OrionAgentStatus,
 )
-from tests.network.mocks import MockOrionAgent
-from network.orion import TaskOrion, TaskStar, TaskStatus
-from network.orion.enums import OrionState, TaskPriority
-from network.orion.task_star_line import TaskStarLine
+from network.agents.schema import WeavingMode
+from tests.network.mocks import MockAsyncQueue, MockOrionAgent
 from network.core.events import TaskEvent, EventType
-from alien.module.context import Context
+from alien.module.context import ContextNames
+
+
+# Fixed timestamp shared by the canned task events below
+_EVENT_TIMESTAMP = time.time()
+
+
+def _make_task_completed_event(
+    task_id: str = "task1",
+    orion=None,
+    source_id: str = "test_orchestrator",
+) -> TaskEvent:
+    """Create a successful TASK_COMPLETED event for a task."""
+    return TaskEvent(
+        event_type=EventType.TASK_COMPLETED,
+        source_id=source_id,
+        timestamp=_EVENT_TIMESTAMP,
+        data={"orion": orion},
+        task_id=task_id,
+        status="completed",
+        result={"success": True},
+        error=None,
+    )
+
+
+def _make_orchestrator():
+    """Create an orchestrator stub without a modification synchronizer."""
+    orchestrator = Mock()
+    orchestrator.orchestrate_orion = AsyncMock()
+    orchestrator._modification_synchronizer = None
+    return orchestrator
 
 
 class TestAgentStateMachine:
@@ -39,74 +61,58 @@ class TestAgentStateMachine:
     @pytest.fixture
     def mock_agent(self):
         """Create a mock agent for testing."""
-        agent = MockOrionAgent()
+        agent = MockOrionAgent(orchestrator=_make_orchestrator())
         agent.current_request = "Test request"
-        agent.orchestrator = Mock()
-        agent.orchestrator.orchestrate_orion = AsyncMock()
         agent.logger = Mock()
+        agent._task_completion_queue = MockAsyncQueue()
         return agent
 
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context for testing."""
-        return Mock(spec=Context)
-
-    @pytest.fixture
-    def simple_orion(self):
-        """Create a simple orion for testing."""
-        orion = TaskOrion("test_orion")
-        task1 = TaskStar("task1", "Test task 1", TaskPriority.MEDIUM)
-        task2 = TaskStar("task2", "Test task 2", TaskPriority.MEDIUM)
-        orion.add_task(task1)
-        orion.add_task(task2)
-
-        # Create dependency using TaskStarLine
-        dependency = TaskStarLine.create_unconditional("task1", "task2")
-        orion.add_dependency(dependency)
-        return orion
-
-    @pytest.mark.asyncio
     async def test_start_state_success(
         self, mock_agent, mock_context, simple_orion
     ):
         """Test successful start state execution."""
         # Arrange
         state = StartOrionAgentState()
-        mock_agent.process_initial_request = AsyncMock(
-            return_value=simple_orion
+        timing_info = {"creation_time": 1.0}
+        mock_agent.process_creation = AsyncMock(
+            return_value=(simple_orion, timing_info)
         )
 
         # Act
         await state.handle(mock_agent, mock_context)
+        # Let the background orchestration task run
+        await asyncio.sleep(0)
 
         # Assert
-        assert mock_agent._status == "executing"
-        assert mock_agent.current_orion == simple_orion
-        assert mock_agent._orchestration_task is not None
-        mock_agent.orchestrator.orchestrate_orion.assert_called_once_with(
-            simple_orion
+        assert mock_agent.status == OrionAgentStatus.CONTINUE.value
+        assert mock_agent.current_orion is simple_orion
+        mock_context.set.assert_called_once_with(
+            ContextNames.WEAVING_MODE, WeavingMode.CREATION
+        )
+        mock_agent.orchestrator.orchestrate_orion.assert_awaited_once_with(
+            simple_orion, metadata=timing_info
         )
 
-    @pytest.mark.asyncio
     async def test_start_state_no_orion(self, mock_agent, mock_context):
         """Test start state when orion creation fails."""
         # Arrange
         state = StartOrionAgentState()
-        mock_agent.process_initial_request = AsyncMock(return_value=None)
+        mock_agent.status = OrionAgentStatus.CONTINUE.value
+        mock_agent.process_creation = AsyncMock(return_value=(None, {}))
 
         # Act
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        assert mock_agent._status == "failed"
+        assert mock_agent.status == OrionAgentStatus.FAIL.value
         assert mock_agent.current_orion is None
+        mock_agent.orchestrator.orchestrate_orion.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_start_state_exception(self, mock_agent, mock_context):
         """Test start state with exception."""
         # Arrange
         state = StartOrionAgentState()
-        mock_agent.process_initial_request = AsyncMock(
+        mock_agent.process_creation = AsyncMock(
             side_effect=Exception("Test error")
         )
 
@@ -114,222 +120,177 @@ class TestAgentStateMachine:
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        assert mock_agent._status == "failed"
+        assert mock_agent.status == OrionAgentStatus.FAIL.value
 
-    def test_start_state_transitions(self, mock_agent):
-        """Test start state transitions."""
+    @pytest.mark.parametrize(
+        "status", [OrionAgentStatus.FINISH, OrionAgentStatus.FAIL]
+    )
+    async def test_start_state_skips_terminal_agent(
+        self, mock_agent, mock_context, status
+    ):
+        """Test start state does nothing once the agent has terminated."""
         state = StartOrionAgentState()
+        mock_agent.status = status.value
+        mock_agent.process_creation = AsyncMock()
 
-        # Test transition to fail
-        mock_agent._status = "failed"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, FailOrionAgentState)
-
-        # Test transition to finish
-        mock_agent._status = "finished"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, FinishOrionAgentState)
-
-        # Test transition to monitor
-        mock_agent._status = "executing"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, MonitorOrionAgentState)
+        await state.handle(mock_agent, mock_context)
 
-    @pytest.mark.asyncio
-    async def test_monitor_state_task_completion(
+        assert mock_agent.status == status.value
+        mock_agent.process_creation.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (OrionAgentStatus.FAIL, FailOrionAgentState),
+            (OrionAgentStatus.FINISH, FinishOrionAgentState),
+            (OrionAgentStatus.CONTINUE, ContinueOrionAgentState),
+        ],
+    )
+    def test_start_state_transition(self, mock_agent, status, expected):
+        """Test start state transitions for each agent status."""
+        mock_agent.status = status.value
+        next_state = StartOrionAgentState().next_state(mock_agent)
+        assert isinstance(next_state, expected)
+
+    async def test_continue_state_task_completion(
         self, mock_agent, mock_context, simple_orion
     ):
-        """Test monitor state handling task completion."""
+        """Test continue state handing a task completion to editing."""
         # Arrange
-        state = MonitorOrionAgentState()
-        mock_agent._current_orion = simple_orion
-        mock_agent.task_completion_queue = asyncio.Queue()
-        mock_agent.update_orion_with_lock = AsyncMock(
-            return_value=simple_orion
-        )
-        mock_agent.should_continue = AsyncMock(return_value=False)
+        state = ContinueOrionAgentState()
+        mock_agent.process_editing = AsyncMock()
 
         # Create task event
-        task_event = TaskEvent(
-            event_type=EventType.TASK_COMPLETED,
-            source_id="test_orchestrator",
-            timestamp=time.time(),
-            data={},
-            task_id="task1",
-            status="completed",
-            result={"success": True},
-            error=None,
-        )
+        task_event = _make_task_completed_event(orion=simple_orion)
 
         # Put event in queue
-        await mock_agent.task_completion_queue.put(task_event)
+        mock_agent.task_completion_queue.put_nowait(task_event)
 
         # Act
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        mock_agent.update_orion_with_lock.assert_called_once()
-        mock_agent.should_continue.assert_called_once()
+        mock_context.set.assert_called_once_with(
+            ContextNames.WEAVING_MODE, WeavingMode.EDITING
+        )
+        mock_agent.process_editing.assert_awaited_once_with(
+            context=mock_context, task_ids=["task1"], before_orion=simple_orion
+        )
+        assert mock_agent.task_completion_queue.empty()
 
-    @pytest.mark.asyncio
-    async def test_monitor_state_continue_processing(
+    async def test_continue_state_collects_pending_events(
         self, mock_agent, mock_context, simple_orion
     ):
-        """Test monitor state when agent decides to continue."""
+        """Test continue state batches every queued event into one edit."""
         # Arrange
-        state = MonitorOrionAgentState()
-        mock_agent._current_orion = simple_orion
-        mock_agent.task_completion_queue = asyncio.Queue()
-        mock_agent.update_orion_with_lock = AsyncMock(
-            return_value=simple_orion
-        )
-        mock_agent.should_continue = AsyncMock(return_value=True)
-
-        # Set orion state to completed but agent wants to continue
-        simple_orion._state = OrionState.COMPLETED
+        state = ContinueOrionAgentState()
+        mock_agent.process_editing = AsyncMock()
 
-        # Create task event
-        task_event = TaskEvent(
-            event_type=EventType.TASK_COMPLETED,
-            source_id="test_orchestrator",
-            timestamp=time.time(),
-            data={},
-            task_id="task1",
-            status="completed",
-            result={"success": True},
-            error=None,
-        )
-
-        await mock_agent.task_completion_queue.put(task_event)
+        # Create one event per task; only the last carries the latest orion
+        for task_id, orion in (("task1", Mock()), ("task2", simple_orion)):
+            task_event = _make_task_completed_event(task_id, orion=orion)
+            mock_agent.task_completion_queue.put_nowait(task_event)
 
         # Act
         await state.handle(mock_agent, mock_context)
 
-        # Assert
-        assert mock_agent._status == "continue"
+        # Assert - the last event carries the latest orion
+        mock_agent.process_editing.assert_awaited_once_with(
+            context=mock_context,
+            task_ids=["task1", "task2"],
+            before_orion=simple_orion,
+        )
 
-    @pytest.mark.asyncio
-    async def test_monitor_state_agent_decides_finish(
+    async def test_continue_state_uses_merged_orion(
         self, mock_agent, mock_context, simple_orion
     ):
-        """Test monitor state when agent decides task is finished."""
+        """Test continue state edits the synchronizer's merged orion."""
         # Arrange
-        state = MonitorOrionAgentState()
-        mock_agent._current_orion = simple_orion
-        mock_agent.task_completion_queue = asyncio.Queue()
-        mock_agent.update_orion_with_lock = AsyncMock(
-            return_value=simple_orion
-        )
-        mock_agent.should_continue = AsyncMock(return_value=False)
-
-        # Set orion to completed
-        simple_orion._state = OrionState.COMPLETED
+        state = ContinueOrionAgentState()
+        merged_orion = Mock(tasks={})
+        synchronizer = Mock()
+        synchronizer.merge_and_sync_orion_states.return_value = merged_orion
+        mock_agent.orchestrator._modification_synchronizer = synchronizer
+        mock_agent.process_editing = AsyncMock()
 
         # Create task event
-        task_event = TaskEvent(
-            event_type=EventType.TASK_COMPLETED,
-            source_id="test_orchestrator",
-            timestamp=time.time(),
-            data={},
-            task_id="task1",
-            status="completed",
-            result={"success": True},
-            error=None,
-        )
+        task_event = _make_task_completed_event(orion=simple_orion)
 
-        await mock_agent.task_completion_queue.put(task_event)
+        mock_agent.task_completion_queue.put_nowait(task_event)
 
         # Act
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        assert mock_agent._status == "finished"
+        synchronizer.merge_and_sync_orion_states.assert_called_once_with(
+            orchestrator_orion=simple_orion
+        )
+        assert (
+            mock_agent.process_editing.await_args.kwargs["before_orion"]
+            is merged_orion
+        )
 
-    @pytest.mark.asyncio
-    async def test_monitor_state_exception_handling(self, mock_agent, mock_context):
-        """Test monitor state exception handling."""
+    async def test_continue_state_exception_handling(
+        self, mock_agent, mock_context, simple_orion
+    ):
+        """Test continue state exception handling."""
         # Arrange
-        state = MonitorOrionAgentState()
-        mock_agent.task_completion_queue = asyncio.Queue()
-        mock_agent.update_orion_with_lock = AsyncMock(
+        state = ContinueOrionAgentState()
+        mock_agent.process_editing = AsyncMock(
             side_effect=Exception("Test error")
         )
 
         # Create task event
-        task_event = TaskEvent(
-            event_type=EventType.TASK_COMPLETED,
-            source_id="test_orchestrator",
-            timestamp=time.time(),
-            data={},
-            task_id="task1",
-            status="completed",
-            result={"success": True},
-            error=None,
-        )
+        task_event = _make_task_completed_event(orion=simple_orion)
 
-        await mock_agent.task_completion_queue.put(task_event)
+        mock_agent.task_completion_queue.put_nowait(task_event)
 
         # Act
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        assert mock_agent._status == "failed"
+        assert mock_agent.status == OrionAgentStatus.FAIL.value
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (OrionAgentStatus.FAIL, FailOrionAgentState),
+            (OrionAgentStatus.FINISH, FinishOrionAgentState),
+            (OrionAgentStatus.START, StartOrionAgentState),
+            (OrionAgentStatus.CONTINUE, ContinueOrionAgentState),
+        ],
+    )
+    def test_continue_state_transition(self, mock_agent, status, expected):
+        """Test continue state transitions for each agent status."""
+        mock_agent.status = status.value
+        next_state = ContinueOrionAgentState().next_state(mock_agent)
+        assert isinstance(next_state, expected)
 
-    def test_monitor_state_transitions(self, mock_agent):
-        """Test monitor state transitions."""
-        state = MonitorOrionAgentState()
-
-        # Test transition to fail
-        mock_agent._status = "failed"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, FailOrionAgentState)
-
-        # Test transition to finish
-        mock_agent._status = "finished"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, FinishOrionAgentState)
-
-        # Test transition to continue (restart)
-        mock_agent._status = "continue"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, StartOrionAgentState)
-
-        # Test stay in monitor
-        mock_agent._status = "monitoring"
-        next_state = state.next_state(mock_agent)
-        assert isinstance(next_state, MonitorOrionAgentState)
-
-    @pytest.mark.asyncio
     async def test_finish_state(self, mock_agent, mock_context):
         """Test finish state execution."""
         # Arrange
         state = FinishOrionAgentState()
-        mock_agent._orchestration_task = Mock()
-        mock_agent._orchestration_task.done.return_value = False
 
         # Act
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        assert mock_agent._status == "finished"
-        mock_agent._orchestration_task.cancel.assert_called_once()
+        assert mock_agent.status == OrionAgentStatus.FINISH.value
+        assert state.next_state(mock_agent) is state
         assert state.is_round_end()
         assert state.is_subtask_end()
 
-    @pytest.mark.asyncio
     async def test_fail_state(self, mock_agent, mock_context):
         """Test fail state execution."""
         # Arrange
         state = FailOrionAgentState()
-        mock_agent._orchestration_task = Mock()
-        mock_agent._orchestration_task.done.return_value = False
 
         # Act
         await state.handle(mock_agent, mock_context)
 
         # Assert
-        assert mock_agent._status == "failed"
-        mock_agent._orchestration_task.cancel.assert_called_once()
+        assert mock_agent.status == OrionAgentStatus.FAIL.value
+        assert state.next_state(mock_agent) is state
         assert state.is_round_end()
         assert state.is_subtask_end()
 
@@ -346,8 +307,8 @@ class TestAgentStateMachine:
             StartOrionAgentState.name() == OrionAgentStatus.START.value
         )
         assert (
-            MonitorOrionAgentState.name()
-            == OrionAgentStatus.MONITOR.value
+            ContinueOrionAgentState.name()
+            == OrionAgentStatus.CONTINUE.value
         )
         assert (
             FinishOrionAgentState.name()
@@ -355,92 +316,61 @@ class TestAgentStateMachine:
         )
         assert FailOrionAgentState.name() == OrionAgentStatus.FAIL.value
 
-    def test_state_properties(self):
-        """Test state properties."""
-        start_state = StartOrionAgentState()
-        assert not start_state.is_round_end()
-        assert not start_state.is_subtask_end()
-
-        monitor_state = MonitorOrionAgentState()
-        assert not monitor_state.is_round_end()
-        assert not monitor_state.is_subtask_end()
-
-        finish_state = FinishOrionAgentState()
-        assert finish_state.is_round_end()
-        assert finish_state.is_subtask_end()
-
-        fail_state = FailOrionAgentState()
-        assert fail_state.is_round_end()
-        assert fail_state.is_subtask_end()
+    @pytest.mark.parametrize(
+        "state_class,is_terminal",
+        [
+            (StartOrionAgentState, False),
+            (ContinueOrionAgentState, False),
+            (FinishOrionAgentState, True),
+            (FailOrionAgentState, True),
+        ],
+    )
+    def test_state_properties(self, state_class, is_terminal):
+        """Test round and subtask end flags for each state."""
+        state = state_class()
+        assert bool(state.is_round_end()) is is_terminal
+        assert bool(state.is_subtask_end()) is is_terminal
 
 
 class TestTaskTimeoutConfiguration:
-    """Test task timeout configuration in start state."""
+    """Test how task timeouts reach the device manager on execution."""
 
     @pytest.fixture
-    def mock_config(self):
-        """Mock config for timeout testing."""
-        config_data = {
-            "NETWORK_TASK_TIMEOUT": 1800.0,
-            "NETWORK_CRITICAL_TASK_TIMEOUT": 3600.0,
-        }
-
-        with patch("alien.config.Config.get_instance") as mock_config_instance:
-            mock_config_instance.return_value.config_data = config_data
-            yield config_data
-
-    @pytest.fixture
-    def simple_orion(self):
-        """Create simple orion for testing."""
-        orion = TaskOrion("test_orion")
-        task1 = TaskStar("task1", "Test task 1", TaskPriority.MEDIUM)
-        task2 = TaskStar("task2", "Test task 2", TaskPriority.MEDIUM)
-        orion.add_task(task1)
-        orion.add_task(task2)
-
-        # Create dependency using TaskStarLine
-        dependency = TaskStarLine.create_unconditional("task1", "task2")
-        orion.add_dependency(dependency)
-        return orion
-
-    @pytest.mark.asyncio
-    async def test_timeout_configuration(self, mock_config, simple_orion):
-        """Test task timeout configuration."""
+    def mock_device_manager(self):
+        """Device manager whose task assignment succeeds immediately."""
+        device_manager = Mock()
+        device_manager.assign_task_to_device = AsyncMock(return_value=Mock())
+        return device_manager
+
+    async def test_timeout_configuration(self, mock_device_manager, simple_orion):
+        """Test tasks without a timeout fall back to the default."""
         # Arrange
-        state = StartOrionAgentState()
-
-        # Set different priorities
         task1 = simple_orion.tasks["task1"]
-        task2 = simple_orion.tasks["task2"]
-        task1.priority = TaskPriority.HIGH  # Should get critical timeout
-        task2.priority = TaskPriority.LOW  # Should get default timeout
-
-        # Clear existing timeouts
+        task1.target_device_id = "device1"
         task1._timeout = None
-        task2._timeout = None
 
         # Act
-        state._configure_task_timeouts(simple_orion)
+        await task1.execute(mock_device_manager)
 
         # Assert
-        assert task1._timeout == 3600.0  # Critical timeout
-        assert task2._timeout == 1800.0  # Default timeout
+        call = mock_device_manager.assign_task_to_device.await_args
+        assert call.kwargs["timeout"] == 1000.0  # Default timeout
 
-    @pytest.mark.asyncio
     async def test_timeout_configuration_preserves_existing(
-        self, mock_config, simple_orion
+        self, mock_device_manager, simple_orion
     ):
         """Test that existing timeouts are preserved."""
         # Arrange
-        state = StartOrionAgentState()
         task1 = simple_orion.tasks["task1"]
+        task1.target_device_id = "device1"
         task1._timeout = 5000.0  # Existing timeout
 
         # Act
-        state._configure_task_timeouts(simple_orion)
+        await task1.execute(mock_device_manager)
 
         # Assert
-        assert task1._timeout == 5000.0  # Should preserve existing
+        call = mock_device_manager.assign_task_to_device.await_args
+        assert call.kwargs["timeout"] == 5000.0  # Should preserve existing
 
 
 class TestAgentIntegration:
@@ -449,133 +379,75 @@ class TestAgentIntegration:
     @pytest.fixture
     def agent_with_states(self):
         """Create agent with state machine support."""
-        agent = MockOrionAgent()
-        agent.orchestrator = Mock()
-        agent.orchestrator.orchestrate_orion = AsyncMock()
-        return agent
+        return MockOrionAgent(orchestrator=_make_orchestrator())
 
-    @pytest.fixture
-    def simple_orion(self):
-        """Create simple orion for testing."""
-        orion = TaskOrion("test_orion")
-        task1 = TaskStar("task1", "Test task 1", TaskPriority.MEDIUM)
-        task2 = TaskStar("task2", "Test task 2", TaskPriority.MEDIUM)
-        orion.add_task(task1)
-        orion.add_task(task2)
-
-        # Create dependency using TaskStarLine
-        dependency = TaskStarLine.create_unconditional("task1", "task2")
-        orion.add_dependency(dependency)
-        return orion
-
-    @pytest.mark.asyncio
     async def test_agent_initialization(self, agent_with_states):
         """Test agent initializes with correct state."""
         assert isinstance(agent_with_states.state, StartOrionAgentState)
+        assert agent_with_states.status == OrionAgentStatus.START.value
         assert hasattr(agent_with_states, "task_completion_queue")
         assert hasattr(agent_with_states, "current_request")
         assert hasattr(agent_with_states, "orchestrator")
 
-    @pytest.mark.asyncio
     async def test_agent_status_manager(self, agent_with_states):
         """Test agent status manager."""
-        manager = agent_with_states.status_manager
-        assert isinstance(manager, OrionAgentStateManager)
-
-    @pytest.mark.asyncio
-    async def test_full_state_cycle_success(
-        self, agent_with_states, simple_orion
+        assert agent_with_states.status_manager is OrionAgentStatus
+
+    @pytest.mark.parametrize(
+        "edited_status,expected_state",
+        [
+            (OrionAgentStatus.FINISH, FinishOrionAgentState),
+            (OrionAgentStatus.CONTINUE, ContinueOrionAgentState),
+        ],
+        ids=["finish", "continue"],
+    )
+    async def test_full_state_cycle(
+        self,
+        agent_with_states,
+        mock_context,
+        simple_orion,
+        edited_status,
+        expected_state,
     ):
-        """Test full successful state cycle."""
+        """Test a full state cycle ending in finish or continuation."""
+        agent = agent_with_states
+
         # Mock methods
-        agent_with_states.process_initial_request = AsyncMock(
-            return_value=simple_orion
-        )
-        agent_with_states.update_orion_with_lock = AsyncMock(
-            return_value=simple_orion
-        )
-        agent_with_states.should_continue = AsyncMock(return_value=False)
+        agent.process_creation = AsyncMock(return_value=(simple_orion, {}))
 
-        # Start -> Monitor (simulate task completion) -> Finish
+        async def process_editing(**kwargs):
+            agent.status = edited_status.value
 
-        # 1. Start state
-        assert isinstance(agent_with_states.state, StartOrionAgentState)
-        await agent_with_states.handle(None)
-
-        # Should transition to monitor
-        next_state = agent_with_states.state.next_state(agent_with_states)
-        agent_with_states.set_state(next_state)
-        assert isinstance(agent_with_states.state, MonitorOrionAgentState)
-
-        # 2. Monitor state - add task completion event
-        task_event = TaskEvent(
-            event_type=EventType.TASK_COMPLETED,
-            source_id="test",
-            timestamp=time.time(),
-            data={},
-            task_id="task1",
-            status="completed",
-            result={"success": True},
-            error=None,
-        )
+        agent.process_editing = AsyncMock(side_effect=process_editing)
 
-        await agent_with_states.task_completion_queue.put(task_event)
-        simple_orion._state = OrionState.COMPLETED
+        # Start -> Continue (simulate task completion) -> Finish or Continue
 
-        await agent_with_states.handle(None)
+        # 1. Start state
+        assert isinstance(agent.state, StartOrionAgentState)
+        await agent.handle(mock_context)
 
-        # Should transition to finish
-        next_state = agent_with_states.state.next_state(agent_with_states)
-        agent_with_states.set_state(next_state)
-        assert isinstance(agent_with_states.state, FinishOrionAgentState)
+        # Should transition to continue
+        agent.set_state(agent.state.next_state(agent))
+        assert isinstance(agent.state, ContinueOrionAgentState)
 
-        # 3. Finish state
-        await agent_with_states.handle(None)
-        assert agent_with_states._status == "finished"
-        assert agent_with_states.state.is_round_end()
-
-    @pytest.mark.asyncio
-    async def test_full_state_cycle_with_continue(
-        self, agent_with_states, simple_orion
-    ):
-        """Test state cycle with continuation."""
-        # Mock methods
-        agent_with_states.process_initial_request = AsyncMock(
-            return_value=simple_orion
-        )
-        agent_with_states.update_orion_with_lock = AsyncMock(
-            return_value=simple_orion
+        # 2. Continue state - add task completion event
+        task_event = _make_task_completed_event(
+            orion=simple_orion, source_id="test"
         )
-        agent_with_states.should_continue = AsyncMock(return_value=True)
 
-        # Start -> Monitor -> Continue -> Start (again)
+        await agent.task_completion_queue.put(task_event)
+        await agent.handle(mock_context)
 
-        # 1. Start state
-        await agent_with_states.handle(None)
-        next_state = agent_with_states.state.next_state(agent_with_states)
-        agent_with_states.set_state(next_state)
-
-        # 2. Monitor state with continuation
-        task_event = TaskEvent(
-            event_type=EventType.TASK_COMPLETED,
-            source_id="test",
-            timestamp=time.time(),
-            data={},
-            task_id="task1",
-            status="completed",
-            result={"success": True},
-            error=None,
-        )
+        next_state = agent.state.next_state(agent)
+        assert isinstance(next_state, expected_state)
 
-        await agent_with_states.task_completion_queue.put(task_event)
-        simple_orion._state = OrionState.COMPLETED
-
-        await agent_with_states.handle(None)
+        # 3. Finish state
+        if expected_state is FinishOrionAgentState:
+            agent.set_state(next_state)
+            await agent.handle(mock_context)
+            assert agent.state.is_round_end()
 
-        # Should transition back to start
-        next_state = agent_with_states.state.next_state(agent_with_states)
-        assert isinstance(next_state, StartOrionAgentState)
-        assert agent_with_states._status == "continue"
+        assert agent.status == edited_status.value
 
 
 if __name__ == "__main__":